@@ -41,6 +41,8 @@ DEFAULT_CONFIG = {
     "staleness_check_limit": 10,  # Only check top N results for staleness
     "staleness_time_threshold_days": 30,
     "staleness_very_stale_threshold_days": 90,
+    # Write notes on a background worker (save returns before the write lands)
+    "async_note_writes": False,
     # Timeouts (can be overridden)
     "timeouts": TIMEOUTS,
 }
@@ -33,6 +33,9 @@ def get_repo_path() -> Optional[str]:
         Repository path if cwd is a git repo, None otherwise
     """
     cwd = os.getcwd()
+    # A .git entry at the root is the common case and needs no git fork
+    if os.path.exists(os.path.join(cwd, ".git")):
+        return cwd
     return cwd if is_git_repo(cwd) else None
 
 
@@ -74,8 +77,9 @@ class ServiceManager:
         if self._collection is None:
             with self._resource_lock:
                 if self._collection is None:
-                    self._client = get_chroma_client()
-                    self._collection = get_or_create_collection(self._client)
+                    # Bind to the shared client so every handle reuses one
+                    # SQLite/HNSW system instead of opening a second client
+                    self._collection = get_or_create_collection(self.chromadb_client)
         return self._collection
 
     @property
@@ -120,6 +124,9 @@ class ServiceManager:
 
     def reset(self) -> None:
         """Reset all services (for testing)."""
+        from src.tools.search.cache import bump_search_epoch
+
+        bump_search_epoch()
         with self._resource_lock:
             self._client = None
             self._collection = None
@@ -129,6 +136,9 @@ class ServiceManager:
 
     def set_collection(self, collection: chromadb.Collection) -> None:
         """Set collection directly (for testing)."""
+        from src.tools.search.cache import bump_search_epoch
+
+        bump_search_epoch()
         with self._resource_lock:
             self._collection = collection
             self._searcher = None  # Reset searcher to use new collection
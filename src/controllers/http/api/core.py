@@ -5,42 +5,50 @@ HTTP endpoints for web clipper, CLI search, notes, and build info.
 """
 
 import hashlib
+import json
 import os
 import time
-import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from fastapi import APIRouter, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Header, Query, Response
+from pydantic import BaseModel, ConfigDict
 
 from src import __version__
 from src.configs import get_logger
 from src.configs.services import get_collection, get_reranker, get_searcher
+from src.tools.search.cache import bump_search_epoch, cache_search, get_cached_search, get_search_epoch
 from src.utils.secret_scrubber import scrub_secrets
 
 logger = get_logger("http.api.core")
 
 router = APIRouter()
 
+# Serialized /info body and its ETag; fixed for the life of the process
+_info_response: Optional[tuple[bytes, str]] = None
+
 
 # --- Request/Response Models ---
 
 
 class IngestRequest(BaseModel):
     """Request body for web content ingestion."""
+    model_config = ConfigDict(frozen=True)
+
     url: str
     content: str
     title: Optional[str] = None
-    tags: Optional[list[str]] = None
+    tags: Optional[tuple[str, ...]] = None
     repository: str = "web"
 
 
 class NoteRequest(BaseModel):
     """Request body for note creation."""
+    model_config = ConfigDict(frozen=True)
+
     content: str
     title: Optional[str] = None
-    tags: Optional[list[str]] = None
+    tags: Optional[tuple[str, ...]] = None
     repository: str = "notes"
 
 
@@ -51,6 +59,19 @@ class SearchResponse(BaseModel):
     timing_ms: float
 
 
+# --- Helpers ---
+
+
+def _content_digest(*parts: str, digest_size: int) -> str:
+    """Hex BLAKE2b digest of the given parts, used for idempotent document IDs."""
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=digest_size).hexdigest()
+
+
+def _already_stored(collection, doc_id: str) -> bool:
+    """Check whether a document ID exists without fetching its content."""
+    return bool(collection.get(ids=[doc_id], include=[])["ids"])
+
+
 # --- Endpoints ---
 
 
@@ -71,8 +92,20 @@ def ingest_web(request: IngestRequest) -> dict[str, Any]:
     # Scrub secrets from content
     clean_content = scrub_secrets(request.content)
 
-    # Generate document ID
-    doc_id = f"web_{hashlib.md5(request.url.encode()).hexdigest()[:12]}_{uuid.uuid4().hex[:8]}"
+    # Deterministic ID: re-clipping the same page content is a no-op
+    url_hash = hashlib.md5(request.url.encode()).hexdigest()[:12]
+    doc_id = f"web_{url_hash}_{_content_digest(request.repository, clean_content, digest_size=4)}"
+
+    collection = get_collection()
+    if _already_stored(collection, doc_id):
+        logger.info(f"Web content already ingested: id={doc_id}")
+        return {
+            "status": "success",
+            "id": doc_id,
+            "url": request.url,
+            "content_length": len(clean_content),
+            "duplicate": True,
+        }
 
     # Build metadata
     now = datetime.now(timezone.utc).isoformat()
@@ -89,12 +122,12 @@ def ingest_web(request: IngestRequest) -> dict[str, Any]:
         metadata["tags"] = ",".join(request.tags)
 
     # Add to collection
-    collection = get_collection()
     collection.add(
         documents=[clean_content],
         ids=[doc_id],
         metadatas=[metadata],
     )
+    bump_search_epoch()
 
     logger.info(f"Ingested web content: id={doc_id}")
     return {
@@ -124,6 +157,15 @@ def search(
     logger.info(f"Search: query='{q}', limit={limit}, repository={repository}")
     start_time = time.time()
 
+    # Repeated queries between writes are served from the search cache
+    cache_key = ("http", q, limit, repository, min_score, get_search_epoch())
+    cached = get_cached_search(cache_key)
+    if cached is not None:
+        response = SearchResponse.model_validate_json(cached)
+        response.timing_ms = round((time.time() - start_time) * 1000, 2)
+        logger.debug(f"Search complete: cache hit in {response.timing_ms}ms")
+        return response
+
     # Build filter
     where_filter = {"repository": repository} if repository else None
 
@@ -141,10 +183,11 @@ def search(
     timing = round((time.time() - start_time) * 1000, 2)
     logger.debug(f"Search complete: {len(filtered)} results in {timing}ms")
 
-    return SearchResponse(
+    response = SearchResponse(
         query=q,
         results=[
             {
+                "id": r.get("id"),
                 "content": r.get("text", ""),
                 "metadata": r.get("meta", {}),
                 "score": r.get("rerank_score"),
@@ -153,6 +196,8 @@ def search(
         ],
         timing_ms=timing,
     )
+    cache_search(cache_key, response.model_dump_json())
+    return response
 
 
 @router.post("/note")
@@ -168,14 +213,25 @@ def save_note(request: NoteRequest) -> dict[str, Any]:
     """
     logger.info(f"Saving note: title={request.title}")
 
-    # Generate document ID
-    doc_id = f"note_{uuid.uuid4().hex[:16]}"
-
     # Build content with optional title
     full_content = request.content
     if request.title:
         full_content = f"# {request.title}\n\n{request.content}"
 
+    # Deterministic ID: saving the same note twice is a no-op
+    doc_id = f"note_{_content_digest(request.repository, full_content, digest_size=8)}"
+
+    collection = get_collection()
+    if _already_stored(collection, doc_id):
+        logger.info(f"Note already saved: id={doc_id}")
+        return {
+            "status": "success",
+            "id": doc_id,
+            "title": request.title,
+            "content_length": len(full_content),
+            "duplicate": True,
+        }
+
     # Build metadata
     now = datetime.now(timezone.utc).isoformat()
     metadata = {
@@ -190,12 +246,12 @@ def save_note(request: NoteRequest) -> dict[str, Any]:
         metadata["tags"] = ",".join(request.tags)
 
     # Add to collection
-    collection = get_collection()
     collection.add(
         documents=[full_content],
         ids=[doc_id],
         metadatas=[metadata],
     )
+    bump_search_epoch()
 
     logger.info(f"Saved note: id={doc_id}")
     return {
@@ -207,21 +263,32 @@ def save_note(request: NoteRequest) -> dict[str, Any]:
 
 
 @router.get("/info")
-def info() -> dict[str, str]:
+def info(if_none_match: Optional[str] = Header(default=None)) -> Response:
     """
     Build and runtime information.
 
     Returns git commit, build time, and startup time for verifying
-    the daemon is running the expected code version.
+    the daemon is running the expected code version. The body is built
+    once per process; clients revalidating with a matching ETag get 304.
     """
-    from src.controllers.http import get_startup_time
-
-    return {
-        "git_commit": os.environ.get("CORTEX_GIT_COMMIT", "unknown"),
-        "build_time": os.environ.get("CORTEX_BUILD_TIME", "unknown"),
-        "startup_time": get_startup_time(),
-        "version": __version__,
-    }
+    global _info_response
+    if _info_response is None:
+        from src.controllers.http import get_startup_time
+
+        body = json.dumps({
+            "git_commit": os.environ.get("CORTEX_GIT_COMMIT", "unknown"),
+            "build_time": os.environ.get("CORTEX_BUILD_TIME", "unknown"),
+            "startup_time": get_startup_time(),
+            "version": __version__,
+        }).encode()
+        _info_response = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+
+    body, etag = _info_response
+    # A restart changes startup_time and therefore the ETag, so always revalidate
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/version/check")
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 from src.configs import get_logger
 from src.configs.services import get_collection, get_searcher
+from src.storage import delete_documents
 
 logger = get_logger("http.browse.write")
 
@@ -153,7 +154,7 @@ def browse_delete(id: str = Query(..., alias="id")) -> dict[str, Any]:
         raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
 
     # Delete the document
-    collection.delete(ids=[doc_id])
+    delete_documents(collection, [doc_id])
 
     # Rebuild search index
     get_searcher().build_index()
@@ -196,7 +197,7 @@ def browse_delete_by_type(
         }
 
     # Delete all matching documents
-    collection.delete(ids=results["ids"])
+    delete_documents(collection, results["ids"])
 
     # Rebuild search index
     get_searcher().build_index()
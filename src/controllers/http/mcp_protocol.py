@@ -74,6 +74,9 @@ class SearchCortexInput(BaseModel):
         None,
         description="Search preset. Overrides types. Valid: 'understanding' (insights, notes), 'navigation' (file_metadata, entry_points), 'structure' (file_metadata, dependencies, skeleton)",
     )
+    include_context: bool = Field(
+        True, description="Include repository skeleton and tech stack/initiative context in the response"
+    )
 
 
 # 3. recall_recent_work
@@ -17,6 +17,7 @@ The server exposes endpoints:
 import argparse
 import json
 import sys
+from functools import lru_cache
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Optional
 
@@ -36,6 +37,9 @@ Output ONLY the summary, no preamble.
 Transcript:
 {transcript}"""
 
+# Split once so summarizing is plain concatenation around the transcript
+_SUMMARIZE_PREFIX, _SUMMARIZE_SUFFIX = SUMMARIZE_PROMPT.split("{transcript}", 1)
+
 
 class ProxyHandler(BaseHTTPRequestHandler):
     """HTTP request handler for proxy requests."""
@@ -125,16 +129,10 @@ class ProxyHandler(BaseHTTPRequestHandler):
             self._send_json({"error": "Generation failed"}, 500)
 
 
-# Lazy-initialized provider instance
-_provider: Optional[ClaudeCLIProvider] = None
-
-
+@lru_cache(maxsize=1)
 def get_provider() -> ClaudeCLIProvider:
-    """Get or create the CLI provider instance."""
-    global _provider
-    if _provider is None:
-        _provider = ClaudeCLIProvider()
-    return _provider
+    """Get or create the CLI provider instance (reset with get_provider.cache_clear())."""
+    return ClaudeCLIProvider()
 
 
 def summarize_with_claude(transcript: str, model: str = "haiku") -> Optional[str]:
@@ -148,7 +146,7 @@ def summarize_with_claude(transcript: str, model: str = "haiku") -> Optional[str
     Returns:
         Summary text or None on failure
     """
-    prompt = SUMMARIZE_PROMPT.format(transcript=transcript)
+    prompt = _SUMMARIZE_PREFIX + transcript + _SUMMARIZE_SUFFIX
     return generate_with_claude(prompt, model)
 
 
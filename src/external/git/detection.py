@@ -4,6 +4,7 @@ Git Detection Utilities
 Functions for detecting git repositories and retrieving git information.
 """
 
+import os
 from typing import Optional
 
 from src.external.git.subprocess_utils import git_check, git_count_lines, git_single_line
@@ -32,9 +33,78 @@ def get_head_commit(path: str) -> Optional[str]:
     Returns:
         Commit hash or None if not a git repo
     """
+    commit = _read_head_commit(path)
+    if commit:
+        return commit
     return git_single_line(["rev-parse", "HEAD"], path)
 
 
+def _read_head_commit(path: str) -> Optional[str]:
+    """
+    Resolve HEAD by reading the .git directory directly, without forking git.
+
+    Only handles the plain layout (path is the repo root and .git is a
+    directory). Returns None for anything else - worktrees, submodules,
+    subdirectories, unborn branches - so callers fall back to git itself.
+
+    Args:
+        path: Repository path
+
+    Returns:
+        Commit hash or None if HEAD could not be resolved from files
+    """
+    git_dir = os.path.join(path, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            # Detached HEAD stores the commit hash directly
+            return head or None
+
+        ref = head[len("ref: "):]
+        try:
+            with open(os.path.join(git_dir, ref)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            pass
+
+        # Ref may have been packed by git gc
+        with open(os.path.join(git_dir, "packed-refs")) as f:
+            for line in f:
+                commit, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return commit
+    except OSError:
+        pass
+    return None
+
+
+def _read_head_branch(path: str) -> Optional[str]:
+    """
+    Resolve the checked-out branch by reading .git/HEAD, without forking git.
+
+    Same layout limits as _read_head_commit. Detached HEADs and unborn
+    branches return None so callers fall back to git, which reports those
+    differently from a plain branch name.
+
+    Args:
+        path: Repository path
+
+    Returns:
+        Branch name or None if it could not be resolved from files
+    """
+    try:
+        with open(os.path.join(path, ".git", "HEAD")) as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+
+    prefix = "ref: refs/heads/"
+    if not head.startswith(prefix) or _read_head_commit(path) is None:
+        return None
+    return head[len(prefix):]
+
+
 def get_git_info(path: str) -> tuple[Optional[str], bool, Optional[str]]:
     """
     Get git information for a path.
@@ -66,6 +136,11 @@ def get_current_branch(path: str) -> str:
     Returns:
         Branch name or 'unknown'
     """
+    # Called on every save and search; avoid three git forks when possible
+    branch = _read_head_branch(path)
+    if branch:
+        return branch
+
     branch, is_git, _ = get_git_info(path)
     return branch if branch else "unknown"
 
@@ -5,6 +5,8 @@ ChromaDB client management and garbage collection.
 """
 
 from src.storage.chromadb import (
+    UpsertBatch,
+    delete_documents,
     get_chroma_client,
     get_collection_stats,
     get_or_create_collection,
@@ -18,12 +20,15 @@ from src.storage.gc import (
     delete_file_chunks,
     purge_by_filters,
 )
+from src.storage.write_queue import enqueue_write, flush_writes
 
 __all__ = [
     # Client management
     "get_chroma_client",
     "get_or_create_collection",
     "get_collection_stats",
+    "delete_documents",
+    "UpsertBatch",
     # Garbage collection
     "delete_file_chunks",
     "cleanup_orphaned_file_metadata",
@@ -32,4 +37,7 @@ __all__ = [
     "cleanup_deprecated_insights",
     "purge_by_filters",
     "delete_document",
+    # Background writes
+    "enqueue_write",
+    "flush_writes",
 ]
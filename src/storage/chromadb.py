@@ -68,3 +68,72 @@ def get_collection_stats(collection: chromadb.Collection) -> dict[str, Any]:
         "document_count": count,
         "estimated_memory_mb": count * 0.01,  # Rough estimate
     }
+
+
+def delete_documents(collection: chromadb.Collection, ids: list[str]) -> None:
+    """
+    Delete documents by ID.
+
+    Deleting an initiative or focus document also invalidates the cached
+    initiative lookups, so later saves cannot resolve to a deleted id.
+
+    Args:
+        collection: ChromaDB collection
+        ids: Document IDs to delete
+    """
+    collection.delete(ids=ids)
+    if any(doc_id.startswith("initiative:") or doc_id.endswith(":focus") for doc_id in ids):
+        # Imported here: src.tools depends on src.storage
+        from src.tools.initiatives.utils import bump_initiative_epoch
+
+        bump_initiative_epoch()
+
+
+class UpsertBatch:
+    """
+    Buffer upserts and send them to ChromaDB in batches.
+
+    Exposes the same upsert() signature as a collection, so code that
+    writes documents one at a time can be handed a batch instead. Each
+    flush embeds and writes every buffered document in one call. A
+    repeated ID replaces the buffered entry, matching sequential upserts.
+    """
+
+    def __init__(self, collection: chromadb.Collection):
+        self.collection = collection
+        self._pending: dict[str, tuple[str, dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def upsert(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Buffer documents for the next flush."""
+        for doc_id, document, metadata in zip(ids, documents, metadatas):
+            self._pending[doc_id] = (document, metadata)
+
+    def merge(self, other: "UpsertBatch") -> None:
+        """Move another batch's buffered documents into this one, as if upserted now."""
+        self._pending.update(other._pending)
+        other._pending = {}
+
+    def flush(self) -> int:
+        """
+        Write all buffered documents in a single upsert.
+
+        Returns:
+            Number of documents written
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        self.collection.upsert(
+            ids=list(pending),
+            documents=[document for document, _ in pending.values()],
+            metadatas=[metadata for _, metadata in pending.values()],
+        )
+        return len(pending)
@@ -8,6 +8,7 @@ Used during delta sync when files are renamed or deleted.
 import chromadb
 
 from src.configs import get_logger
+from src.storage.chromadb import delete_documents
 
 logger = get_logger("storage.gc.file_chunks")
 
@@ -46,7 +47,7 @@ def delete_file_chunks(
             )
 
             if results["ids"]:
-                collection.delete(ids=results["ids"])
+                delete_documents(collection, results["ids"])
                 deleted_count += len(results["ids"])
                 logger.debug(f"Deleted {len(results['ids'])} chunks for: {file_path}")
 
@@ -14,6 +14,7 @@ from typing import Any
 import chromadb
 
 from src.configs import get_logger
+from src.storage.chromadb import delete_documents
 
 logger = get_logger("storage.gc.orphans")
 
@@ -65,7 +66,7 @@ def cleanup_orphaned_file_metadata(
 
         deleted = 0
         if orphaned_ids and not dry_run:
-            collection.delete(ids=orphaned_ids)
+            delete_documents(collection, orphaned_ids)
             deleted = len(orphaned_ids)
             logger.info(f"Deleted {deleted} orphaned file_metadata documents")
 
@@ -139,7 +140,7 @@ def cleanup_orphaned_insights(
 
         deleted = 0
         if orphaned_ids and not dry_run:
-            collection.delete(ids=orphaned_ids)
+            delete_documents(collection, orphaned_ids)
             deleted = len(orphaned_ids)
             logger.info(f"Deleted {deleted} orphaned insight documents")
 
@@ -199,7 +200,7 @@ def cleanup_orphaned_dependencies(
 
         deleted = 0
         if orphaned_ids and not dry_run:
-            collection.delete(ids=orphaned_ids)
+            delete_documents(collection, orphaned_ids)
             deleted = len(orphaned_ids)
             logger.info(f"Deleted {deleted} orphaned dependency documents")
 
@@ -11,6 +11,7 @@ from typing import Any
 import chromadb
 
 from src.configs import get_logger
+from src.storage.chromadb import delete_documents
 
 logger = get_logger("storage.gc.purge")
 
@@ -71,7 +72,7 @@ def cleanup_deprecated_insights(
                 ids_to_delete.append(doc_id)
 
         if ids_to_delete:
-            collection.delete(ids=ids_to_delete)
+            delete_documents(collection, ids_to_delete)
             logger.info(f"Cleaned up {len(ids_to_delete)} deprecated insights older than {max_age_days} days")
             return len(ids_to_delete)
 
@@ -159,7 +160,7 @@ def purge_by_filters(
 
         deleted_count = 0
         if ids_to_delete and not dry_run:
-            collection.delete(ids=ids_to_delete)
+            delete_documents(collection, ids_to_delete)
             deleted_count = len(ids_to_delete)
             logger.info(f"Purged {deleted_count} documents matching filters")
 
@@ -221,7 +222,7 @@ def delete_document(
         doc_type = meta.get("type", "unknown")
 
         # Delete the document
-        collection.delete(ids=[document_id])
+        delete_documents(collection, [document_id])
 
         logger.info(f"Deleted document: {document_id} (type={doc_type})")
 
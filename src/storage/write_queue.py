@@ -0,0 +1,59 @@
+"""
+Background Write Queue
+
+Optional write-behind for memory saves. Jobs run in order on a single
+daemon worker, so the caller can return as soon as the document ID is
+known instead of waiting for embedding and the SQLite write.
+
+Readers that need their own writes call flush_writes() first; the queue
+is also drained at interpreter exit.
+"""
+
+import atexit
+import queue
+import threading
+from typing import Callable, Optional
+
+from src.configs import get_logger
+
+logger = get_logger("storage.write_queue")
+
+_WRITE_QUEUE: "queue.Queue[Callable[[], None]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _run_worker() -> None:
+    """Apply queued writes one at a time, forever."""
+    while True:
+        job = _WRITE_QUEUE.get()
+        try:
+            job()
+        except Exception as e:
+            logger.error(f"Background write failed: {e}")
+        finally:
+            _WRITE_QUEUE.task_done()
+
+
+def enqueue_write(job: Callable[[], None]) -> None:
+    """
+    Queue a write to run on the background worker.
+
+    Args:
+        job: Callable performing the write; errors are logged, not raised
+    """
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_run_worker, name="cortex-writer", daemon=True)
+                _worker.start()
+    _WRITE_QUEUE.put(job)
+
+
+def flush_writes() -> None:
+    """Block until every queued write has been applied."""
+    _WRITE_QUEUE.join()
+
+
+atexit.register(flush_writes)
@@ -14,6 +14,7 @@ from src.configs import get_logger
 from src.external.git import get_current_branch
 from src.utils.secret_scrubber import scrub_secrets
 from src.configs.services import CONFIG, get_collection, get_repo_path, get_searcher
+from src.tools.search.cache import bump_search_epoch
 
 logger = get_logger("tools.admin")
 
@@ -132,6 +133,8 @@ def configure_cortex(
         changes.extend(autocapture_changes)
 
     if changes:
+        # Runtime settings change ranking and thresholds of cached searches
+        bump_search_epoch()
         logger.info(f"Configuration updated: {', '.join(changes)}")
     else:
         logger.debug("Configure called with no changes")
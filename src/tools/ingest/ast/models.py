@@ -115,6 +115,9 @@ class FileMetadata:
 
     # Staleness tracking
     file_hash: Optional[str] = None
+    # Stat fingerprint at ingest time; lets hash delta sync skip unchanged files
+    file_size: Optional[int] = None
+    file_mtime_ns: Optional[int] = None
 
     def get_export_list(self) -> list[str]:
         """Get all exported symbols (classes, functions, explicit exports)."""
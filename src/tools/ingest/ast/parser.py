@@ -4,6 +4,7 @@ Tree-sitter Parser Wrapper
 Handles language detection and tree-sitter parsing for multiple languages.
 """
 
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -44,13 +45,23 @@ class ASTParser:
     """
     Tree-sitter based parser for multiple languages.
 
-    Lazily initializes parsers for each language on first use.
+    Lazily initializes parsers for each language on first use. Language
+    objects are shared; tree-sitter Parsers are not thread-safe, so each
+    thread gets its own.
     """
 
     def __init__(self):
-        self._parsers: dict[str, Parser] = {}
+        self._local = threading.local()
         self._languages: dict[str, Language] = {}
 
+    @property
+    def _parsers(self) -> dict[str, Parser]:
+        """Parsers created by the current thread."""
+        parsers = getattr(self._local, "parsers", None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        return parsers
+
     def _get_language(self, lang_name: str) -> Optional[Language]:
         """Get or create Language object for a language."""
         if lang_name in self._languages:
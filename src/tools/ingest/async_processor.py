@@ -107,8 +107,9 @@ class IngestionTaskStore:
 
         fd, tmp_path = tempfile.mkstemp(dir=str(self._file_path.parent))
         try:
+            # Compact: rewritten on every progress update of a running ingest
             with os.fdopen(fd, "w") as f:
-                json.dump(state, f, indent=2)
+                json.dump(state, f, separators=(",", ":"))
             os.replace(tmp_path, str(self._file_path))
         except Exception:
             if os.path.exists(tmp_path):
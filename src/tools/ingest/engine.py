@@ -6,6 +6,7 @@ Main ingestion logic for files and codebases.
 
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,7 +19,7 @@ from src.external.git import get_current_branch, get_git_changed_files, get_head
 from src.tools.ingest.skeleton import generate_tree_structure, store_skeleton
 from src.tools.ingest.walker import compute_file_hash, get_changed_files, walk_codebase
 from src.external.llm import LLMProvider
-from src.storage import delete_file_chunks
+from src.storage import UpsertBatch, delete_file_chunks
 
 logger = get_logger("ingest.engine")
 
@@ -54,12 +55,12 @@ def get_indexed_commit_from_db(
     return None
 
 
-def get_file_hashes_from_db(
+def get_file_state_from_db(
     collection: chromadb.Collection,
     repo_id: str,
-) -> dict[str, str]:
+) -> tuple[dict[str, str], dict[str, tuple[int, int]]]:
     """
-    Load file hashes from file_metadata documents in ChromaDB.
+    Load file hashes and stat fingerprints from file_metadata documents in ChromaDB.
 
     Used for hash-based delta sync in non-git repos.
 
@@ -68,7 +69,9 @@ def get_file_hashes_from_db(
         repo_id: Repository identifier
 
     Returns:
-        Dict mapping file_path -> file_hash
+        Tuple of (file_path -> file_hash, file_path -> (size, mtime_ns)).
+        Documents ingested before fingerprints were recorded only appear
+        in the first dict.
     """
     try:
         result = collection.get(
@@ -80,14 +83,19 @@ def get_file_hashes_from_db(
             },
             include=["metadatas"],
         )
-        return {
-            meta["file_path"]: meta.get("file_hash", "")
-            for meta in result.get("metadatas", [])
-            if meta.get("file_path") and meta.get("file_hash")
-        }
+        file_hashes: dict[str, str] = {}
+        file_stats: dict[str, tuple[int, int]] = {}
+        for meta in result.get("metadatas", []):
+            path = meta.get("file_path")
+            if not path or not meta.get("file_hash"):
+                continue
+            file_hashes[path] = meta["file_hash"]
+            if "file_size" in meta and "file_mtime_ns" in meta:
+                file_stats[path] = (meta["file_size"], meta["file_mtime_ns"])
+        return file_hashes, file_stats
     except Exception as e:
         logger.warning(f"Could not load file hashes from DB: {e}")
-        return {}
+        return {}, {}
 
 
 # Progress callback: (files_processed, files_total, docs_created) -> None
@@ -96,6 +104,13 @@ ProgressCallback = Callable[[int, int, int], None]
 # Progress update interval (every N files)
 PROGRESS_BATCH_SIZE = 10
 
+# Buffered documents that trigger a ChromaDB write during file processing
+UPSERT_BATCH_SIZE = 256
+
+# Threads extracting file metadata, and how many files they may run ahead
+INGEST_WORKERS = 4
+INGEST_WINDOW = 64
+
 
 # =============================================================================
 # Delta Sync Strategy Pattern
@@ -209,11 +224,13 @@ class HashDeltaSyncStrategy(DeltaSyncStrategy):
         file_hashes: dict[str, str],
         include_patterns: Optional[list[str]],
         use_cortexignore: bool,
+        file_stats: Optional[dict[str, tuple[int, int]]] = None,
     ):
         self.root_path = root_path
         self.file_hashes = file_hashes
         self.include_patterns = include_patterns
         self.use_cortexignore = use_cortexignore
+        self.file_stats = file_stats or {}
 
     def get_files_to_process(self) -> DeltaSyncResult:
         all_files = list(walk_codebase(
@@ -222,8 +239,8 @@ class HashDeltaSyncStrategy(DeltaSyncStrategy):
             use_cortexignore=self.use_cortexignore,
         ))
 
-        # Filter to changed files using MD5 hashes
-        files_to_process = get_changed_files(all_files, self.file_hashes)
+        # Filter to changed files: stat fingerprint first, MD5 hash on mismatch
+        files_to_process = get_changed_files(all_files, self.file_hashes, self.file_stats)
 
         skipped_unchanged = len(all_files) - len(files_to_process)
         if skipped_unchanged > 0:
@@ -272,12 +289,13 @@ def select_delta_strategy(
             return GitDeltaSyncStrategy(root_path, last_commit, include_patterns, use_cortexignore)
 
     # Fall back to hash-based delta for non-git or first-time indexing
-    file_hashes = get_file_hashes_from_db(collection, repo_id)
+    file_hashes, file_stats = get_file_state_from_db(collection, repo_id)
     return HashDeltaSyncStrategy(
         root_path,
         file_hashes,
         include_patterns,
         use_cortexignore,
+        file_stats,
     )
 
 
@@ -356,6 +374,50 @@ class MetadataFileProcessor:
             logger.info(f"Cleaned up {deleted} old code chunks for {len(path_strs)} files")
         return deleted
 
+    def _record_result(
+        self,
+        file_path: Path,
+        result: Any,
+        file_hashes: dict[str, str],
+        results: list,
+        errors: list[dict],
+        counts: dict[str, int],
+    ) -> None:
+        """Fold one file's ingestion result (or the exception it raised) into the totals."""
+        if isinstance(result, Exception):
+            logger.warning(f"Error processing {file_path}: {result}")
+            errors.append({"file": str(file_path), "error": str(result)})
+            counts["skipped"] += 1
+            return
+
+        if result.error:
+            counts["skipped"] += 1
+            if "Unsupported" not in result.error and "Empty" not in result.error:
+                errors.append({"file": str(file_path), "error": result.error})
+        else:
+            counts["processed"] += 1
+            # Count documents created
+            if result.file_metadata_id:
+                counts["docs_created"] += 1
+            counts["docs_created"] += len(result.data_contract_ids)
+            if result.entry_point_id:
+                counts["docs_created"] += 1
+
+            # Update hash if available
+            if result.metadata and result.metadata.file_hash:
+                file_hashes[str(file_path)] = result.metadata.file_hash
+
+        results.append(result)
+
+    def _flush_batch(self, batch: UpsertBatch, errors: list[dict]) -> None:
+        """Write buffered documents, recording a failure against the whole batch."""
+        pending = len(batch)
+        try:
+            batch.flush()
+        except Exception as e:
+            logger.warning(f"Error writing batch of {pending} documents: {e}")
+            errors.append({"file": f"<batch of {pending} documents>", "error": str(e)})
+
     def process_files(
         self,
         files: list[Path],
@@ -379,52 +441,53 @@ class MetadataFileProcessor:
         # Clean up old code chunks before processing
         self._cleanup_old_code_chunks(files)
 
-        processed = 0
-        skipped = 0
-        docs_created = 0
+        counts = {"processed": 0, "skipped": 0, "docs_created": 0}
         errors = []
         results = []
         total_files = len(files)
 
-        for i, file_path in enumerate(files):
+        # Documents from many files are embedded and written together
+        batch = UpsertBatch(self.collection)
+
+        def extract(file_path: Path) -> tuple[Any, UpsertBatch]:
+            """Read, parse and describe one file, buffering its documents locally."""
+            buffered = UpsertBatch(self.collection)
             try:
                 result = ingest_file_metadata(
                     file_path=file_path,
-                    collection=self.collection,
+                    collection=buffered,
                     repo_id=self.repo_id,
                     branch=self.branch,
                     llm_provider=self.llm_provider,
                 )
-
-                if result.error:
-                    skipped += 1
-                    if "Unsupported" not in result.error and "Empty" not in result.error:
-                        errors.append({"file": str(file_path), "error": result.error})
-                else:
-                    processed += 1
-                    # Count documents created
-                    if result.file_metadata_id:
-                        docs_created += 1
-                    docs_created += len(result.data_contract_ids)
-                    if result.entry_point_id:
-                        docs_created += 1
-
-                    # Update hash if available
-                    if result.metadata and result.metadata.file_hash:
-                        file_hashes[str(file_path)] = result.metadata.file_hash
-
-                results.append(result)
-
             except Exception as e:
-                logger.warning(f"Error processing {file_path}: {e}")
-                errors.append({"file": str(file_path), "error": str(e)})
-                skipped += 1
-
-            # Report progress every PROGRESS_BATCH_SIZE files or on last file
-            if progress_callback and (
-                (i + 1) % PROGRESS_BATCH_SIZE == 0 or i == total_files - 1
-            ):
-                progress_callback(i + 1, total_files, docs_created)
+                result = e
+            return result, buffered
+
+        # Workers overlap file reads, parsing and LLM description calls while
+        # results are consumed in file order; windows bound how far ahead they run
+        with ThreadPoolExecutor(max_workers=INGEST_WORKERS, thread_name_prefix="ingest") as pool:
+            for start in range(0, total_files, INGEST_WINDOW):
+                window = files[start:start + INGEST_WINDOW]
+                for i, file_path, (result, buffered) in zip(
+                    range(start, total_files), window, pool.map(extract, window)
+                ):
+                    batch.merge(buffered)
+                    self._record_result(file_path, result, file_hashes, results, errors, counts)
+
+                    if len(batch) >= UPSERT_BATCH_SIZE:
+                        self._flush_batch(batch, errors)
+
+                    # Report progress every PROGRESS_BATCH_SIZE files or on last file
+                    if progress_callback and (
+                        (i + 1) % PROGRESS_BATCH_SIZE == 0 or i == total_files - 1
+                    ):
+                        progress_callback(i + 1, total_files, counts["docs_created"])
+
+        # Dependency and test linking read the stored documents
+        self._flush_batch(batch, errors)
+
+        processed, skipped, docs_created = counts["processed"], counts["skipped"], counts["docs_created"]
 
         # Build dependency graph after all files processed
         if results:
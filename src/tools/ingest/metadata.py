@@ -14,6 +14,7 @@ Philosophy: "Code can be grepped. Understanding cannot."
 """
 
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -26,7 +27,7 @@ from src.tools.ingest.ast.parser import get_parser
 from src.tools.ingest.ast.extractors import get_extractor  # Import from package to trigger registration
 from src.tools.ingest.ast.description import generate_description_from_metadata
 from src.tools.ingest.ast.models import DataContractInfo, FileMetadata
-from src.tools.ingest.walker import compute_file_hash
+from src.tools.ingest.walker import compute_content_hash
 from src.external.llm import LLMProvider
 from src.utils.secret_scrubber import scrub_secrets
 
@@ -40,6 +41,9 @@ if TYPE_CHECKING:
 
 logger = get_logger("ingest.metadata")
 
+# Leading characters checked for NUL bytes before a file is treated as text
+BINARY_SNIFF_SIZE = 8192
+
 
 @dataclass
 class MetadataIngestionResult:
@@ -70,7 +74,7 @@ def ingest_file_metadata(
 
     Args:
         file_path: Path to the source file
-        collection: ChromaDB collection
+        collection: ChromaDB collection, or an UpsertBatch to buffer the writes
         repo_id: Repository identifier
         branch: Git branch name
         llm_provider: Optional LLM provider for descriptions
@@ -80,23 +84,8 @@ def ingest_file_metadata(
     """
     result = MetadataIngestionResult(file_path=str(file_path))
 
-    # Read and validate file
-    try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-    except (OSError, IOError) as e:
-        result.error = f"Read error: {e}"
-        logger.debug(f"Skipped (read error): {file_path}")
-        return result
-
-    if not content.strip():
-        result.error = "Empty file"
-        logger.debug(f"Skipped (empty): {file_path}")
-        return result
-
-    # Scrub secrets
-    content = scrub_secrets(content)
-
-    # Get parser and extractor
+    # Get parser and extractor (language comes from the path, so files we
+    # cannot use are skipped before they are read)
     parser = get_parser()
     language = parser.detect_language(str(file_path))
 
@@ -111,6 +100,37 @@ def ingest_file_metadata(
         logger.debug(f"Skipped (no extractor): {file_path}")
         return result
 
+    # Read and validate file (stat first, so a write racing the read
+    # leaves a stale fingerprint and the file is re-checked next sync)
+    try:
+        stat = os.stat(file_path)
+        raw = file_path.read_bytes()
+    except (OSError, IOError) as e:
+        result.error = f"Read error: {e}"
+        logger.debug(f"Skipped (read error): {file_path}")
+        return result
+
+    # One read serves both the hash and the text (newlines normalized as
+    # text-mode reading would)
+    file_hash = compute_content_hash(raw)
+    content = raw.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+    del raw
+
+    if not content.strip():
+        result.error = "Empty file"
+        logger.debug(f"Skipped (empty): {file_path}")
+        return result
+
+    # A NUL in the first 8 KiB means binary content behind a source
+    # extension (the same heuristic git uses)
+    if "\x00" in content[:BINARY_SNIFF_SIZE]:
+        result.error = "Unsupported (binary content)"
+        logger.debug(f"Skipped (binary): {file_path}")
+        return result
+
+    # Scrub secrets
+    content = scrub_secrets(content)
+
     # Parse and extract metadata
     tree = parser.parse(content, language)
     if tree is None:
@@ -119,7 +139,9 @@ def ingest_file_metadata(
         return result
 
     metadata = extractor.extract_all(tree, content, str(file_path))
-    metadata.file_hash = compute_file_hash(file_path)
+    metadata.file_hash = file_hash
+    metadata.file_size = stat.st_size
+    metadata.file_mtime_ns = stat.st_mtime_ns
     result.metadata = metadata
 
     # Generate LLM description
@@ -201,6 +223,9 @@ def _store_file_metadata(
         meta["entry_point_type"] = metadata.entry_point_type
     if metadata.file_hash:
         meta["file_hash"] = metadata.file_hash
+    if metadata.file_size is not None and metadata.file_mtime_ns is not None:
+        meta["file_size"] = metadata.file_size
+        meta["file_mtime_ns"] = metadata.file_mtime_ns
 
     collection.upsert(
         ids=[doc_id],
@@ -6,6 +6,7 @@ Generate, store, and retrieve tree structure for file-path grounding.
 
 import fnmatch
 import json
+import os
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
@@ -116,47 +117,48 @@ def _generate_tree_fallback(
                     return True
         return False
 
-    def traverse(path: Path, prefix: str = "", depth: int = 0, rel_prefix: str = "") -> list[str]:
+    def traverse(path: str, prefix: str = "", depth: int = 0, rel_prefix: str = "") -> list[str]:
         if depth > max_depth:
             return []
 
         lines = []
         try:
-            items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-            # Filter ignored items
-            items = [
-                i
-                for i in items
-                if i.name not in ignore
-                and not i.name.startswith(".")
-                and not i.name.endswith(".egg-info")
-            ]
+            # Filter ignored entries before classifying them, so pruned names
+            # are never stat'ed; each remaining entry is classified once
+            with os.scandir(path) as it:
+                items = [
+                    (e.is_dir(), e)
+                    for e in it
+                    if e.name not in ignore
+                    and not e.name.startswith(".")
+                    and not e.name.endswith(".egg-info")
+                ]
+            items.sort(key=lambda x: (not x[0], x[1].name.lower()))
 
             # Filter by include patterns if specified
             if include_patterns:
-                filtered_items = []
-                for item in items:
-                    rel_path = f"{rel_prefix}/{item.name}" if rel_prefix else item.name
-                    if matches_include(rel_path, item.is_dir()):
-                        filtered_items.append(item)
-                items = filtered_items
-
-            for i, item in enumerate(items):
+                items = [
+                    (is_dir, item)
+                    for is_dir, item in items
+                    if matches_include(f"{rel_prefix}/{item.name}" if rel_prefix else item.name, is_dir)
+                ]
+
+            for i, (is_dir, item) in enumerate(items):
                 is_last = i == len(items) - 1
                 current_prefix = "└── " if is_last else "├── "
                 lines.append(f"{prefix}{current_prefix}{item.name}")
 
-                if item.is_dir():
+                if is_dir:
                     next_prefix = prefix + ("    " if is_last else "│   ")
                     next_rel = f"{rel_prefix}/{item.name}" if rel_prefix else item.name
-                    lines.extend(traverse(item, next_prefix, depth + 1, next_rel))
+                    lines.extend(traverse(item.path, next_prefix, depth + 1, next_rel))
         except PermissionError:
             pass
 
         return lines
 
     tree_lines = [root.name]
-    tree_lines.extend(traverse(root))
+    tree_lines.extend(traverse(str(root)))
     return "\n".join(tree_lines)
 
 
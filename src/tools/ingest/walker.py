@@ -6,13 +6,24 @@ File system traversal with filtering for code files.
 
 import fnmatch
 import hashlib
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Generator, Optional
 
 from src.configs.constants import BINARY_EXTENSIONS, MAX_FILE_SIZE
 from src.configs.ignore_patterns import load_ignore_patterns
 
+# Files larger than this are hashed through a memory map instead of buffered reads
+MMAP_HASH_THRESHOLD = 8 * 1024 * 1024  # 8 MiB
+
+# Read size for hashing smaller files; most source files fit in one read
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Threads hashing candidate files in get_changed_files
+HASH_MAX_WORKERS = 8
+
 
 def walk_codebase(
     root_path: str,
@@ -40,41 +51,62 @@ def walk_codebase(
     if ignore_patterns:
         ignore = ignore | ignore_patterns
 
-    root = Path(root_path)
+    # Relative paths are sliced off each entry's path instead of relative_to()
+    root_prefix_len = len(os.path.join(root_path, ""))
 
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Filter out ignored directories (in-place modification)
-        dirnames[:] = [
-            d
-            for d in dirnames
-            if d not in ignore and not d.startswith(".") and not d.endswith(".egg-info")
-        ]
+    # Directories still to scan. DirEntry caches the d_type from the
+    # directory read, so classifying entries needs no extra stat.
+    pending = [root_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
 
-        for filename in filenames:
-            file_path = Path(dirpath) / filename
+        subdirs = []
+        for entry in entries:
+            name = entry.name
 
-            # Skip hidden files
-            if filename.startswith("."):
+            # Skip hidden files and directories
+            if name.startswith("."):
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            if is_dir:
+                # Prune ignored trees here so they are never opened; like
+                # os.walk, symlinked directories are not followed
+                if (
+                    name not in ignore
+                    and not name.endswith(".egg-info")
+                    and not entry.is_symlink()
+                ):
+                    subdirs.append(entry.path)
                 continue
 
             # Skip binary/large files
-            if file_path.suffix.lower() in BINARY_EXTENSIONS:
+            suffix = os.path.splitext(name)[1].lower()
+            if suffix in BINARY_EXTENSIONS:
+                continue
+
+            # Filter by extension if specified
+            if extensions and suffix not in extensions:
                 continue
 
             # Check file size
             try:
-                if file_path.stat().st_size > MAX_FILE_SIZE:
+                if entry.stat().st_size > MAX_FILE_SIZE:
                     continue
             except OSError:
                 continue
 
-            # Filter by extension if specified
-            if extensions and file_path.suffix.lower() not in extensions:
-                continue
-
             # Check if file matches any ignore pattern
-            rel_path = str(file_path.relative_to(root))
-            if any(fnmatch.fnmatch(filename, p) or fnmatch.fnmatch(rel_path, p) for p in ignore):
+            rel_path = entry.path[root_prefix_len:]
+            if any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(rel_path, p) for p in ignore):
                 continue
 
             # Filter by include patterns if specified
@@ -82,29 +114,64 @@ def walk_codebase(
                 if not any(fnmatch.fnmatch(rel_path, p) for p in include_patterns):
                     continue
 
-            yield file_path
+            yield Path(entry.path)
 
+        # Reversed so directories are visited in the order they were listed
+        pending.extend(reversed(subdirs))
 
-def compute_file_hash(file_path: Path) -> str:
+
+def compute_file_hash(file_path: Path, size: Optional[int] = None) -> str:
     """
     Compute MD5 hash of a file for delta sync.
 
     Args:
         file_path: Path to the file
+        size: File size in bytes if the caller already has it from a stat;
+              files above MMAP_HASH_THRESHOLD are hashed via mmap
 
     Returns:
         MD5 hash as hex string
     """
     hasher = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
+    # Unbuffered: reads go straight into our own buffer
+    with open(file_path, "rb", buffering=0) as f:
+        # Re-check on the open descriptor: the file may have been truncated
+        # since the caller's stat, and mmap cannot map an empty file
+        if (
+            size is not None
+            and size > MMAP_HASH_THRESHOLD
+            and os.fstat(f.fileno()).st_size > 0
+        ):
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            buf = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                hasher.update(view[:n])
     return hasher.hexdigest()
 
 
+def compute_content_hash(data: bytes) -> str:
+    """
+    Hash file contents already in memory.
+
+    Produces the same digest as compute_file_hash on a file holding these
+    bytes, for callers that have read the file anyway.
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        MD5 hash as hex string
+    """
+    return hashlib.md5(data).hexdigest()
+
+
 def get_changed_files(
     file_paths: list[Path],
     state: dict[str, str],
+    file_stats: Optional[dict[str, tuple[int, int]]] = None,
 ) -> list[Path]:
     """
     Return only files that have changed since last ingestion.
@@ -112,20 +179,44 @@ def get_changed_files(
     Args:
         file_paths: List of file paths to check
         state: State dictionary with file path -> hash mappings
+        file_stats: Optional file path -> (size, mtime_ns) recorded at last
+                    ingestion; files whose stat still matches are treated as
+                    unchanged without being hashed
 
     Returns:
         List of paths that have changed
     """
-    changed = []
+    file_stats = file_stats or {}
 
+    # Cheap pass: stat every file, keep those that need hashing
+    to_hash: list[tuple[Path, int]] = []
     for file_path in file_paths:
         path_str = str(file_path)
         try:
-            current_hash = compute_file_hash(file_path)
-            if state.get(path_str) != current_hash:
-                changed.append(file_path)
-        except (OSError, IOError):
-            # If we can't read the file, skip it
+            st = os.stat(file_path)
+        except OSError:
+            # If we can't stat the file, skip it
             continue
+        if path_str in state and file_stats.get(path_str) == (st.st_size, st.st_mtime_ns):
+            continue
+        to_hash.append((file_path, st.st_size))
 
-    return changed
+    def hash_or_none(item: tuple[Path, int]) -> Optional[str]:
+        try:
+            return compute_file_hash(item[0], size=item[1])
+        except (OSError, IOError):
+            # If we can't read the file, skip it
+            return None
+
+    # hashlib releases the GIL on large updates, so threads overlap I/O and hashing
+    if len(to_hash) > 1:
+        with ThreadPoolExecutor(max_workers=HASH_MAX_WORKERS, thread_name_prefix="hash") as pool:
+            hashes = list(pool.map(hash_or_none, to_hash))
+    else:
+        hashes = [hash_or_none(item) for item in to_hash]
+
+    return [
+        file_path
+        for (file_path, _), current_hash in zip(to_hash, hashes)
+        if current_hash is not None and state.get(str(file_path)) != current_hash
+    ]
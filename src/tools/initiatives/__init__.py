@@ -24,11 +24,13 @@ from src.tools.initiatives.initiatives import (
 from src.tools.initiatives.utils import (
     COMPLETION_SIGNALS,
     STALE_THRESHOLD_DAYS,
+    bump_initiative_epoch,
     calculate_duration,
     calculate_duration_from_now,
     check_initiative_staleness,
     detect_completion_signals,
     find_initiative,
+    get_initiative_epoch,
     resolve_initiative,
     resolve_initiative_id,
 )
@@ -61,4 +63,6 @@ __all__ = [
     "calculate_duration_from_now",
     "detect_completion_signals",
     "check_initiative_staleness",
+    "get_initiative_epoch",
+    "bump_initiative_epoch",
 ]
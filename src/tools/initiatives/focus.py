@@ -10,6 +10,8 @@ from typing import Optional
 
 from src.configs import get_logger
 from src.configs.services import get_collection
+from src.storage import delete_documents
+from src.tools.initiatives.utils import bump_initiative_epoch
 
 logger = get_logger("tools.initiatives.focus")
 
@@ -50,6 +52,13 @@ def set_focus(
             "updated_at": timestamp,
         }],
     )
+    bump_initiative_epoch()
+
+    # Focus drives the initiative boost of search results. Imported lazily:
+    # src.tools.search imports this module.
+    from src.tools.search.cache import bump_search_epoch
+
+    bump_search_epoch()
     return {"initiative_id": initiative_id, "initiative_name": initiative_name}
 
 
@@ -114,7 +123,11 @@ def clear_focus(collection, repository: str) -> None:
     """
     try:
         focus_id = f"{repository}:focus"
-        collection.delete(ids=[focus_id])
+        delete_documents(collection, [focus_id])
+
+        from src.tools.search.cache import bump_search_epoch
+
+        bump_search_epoch()
     except Exception as e:
         logger.warning(f"Failed to clear focus: {e}")
 
@@ -21,6 +21,7 @@ from src.tools.initiatives.focus import (
 )
 from src.tools.initiatives.utils import (
     STALE_THRESHOLD_DAYS,
+    bump_initiative_epoch,
     calculate_duration,
     calculate_duration_from_now,
     check_initiative_staleness,
@@ -157,6 +158,7 @@ def _create_initiative(
             }],
         )
 
+        bump_initiative_epoch()
         logger.info(f"Initiative created: {initiative_id}")
 
         # Auto-focus if requested
@@ -6,6 +6,7 @@ Includes lookup, resolution, duration calculation, and detection utilities.
 """
 
 import re
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -22,6 +23,65 @@ COMPLETION_SIGNALS = [
 # Default stale threshold in days
 STALE_THRESHOLD_DAYS = 5
 
+# Bumped whenever initiatives or focus change; callers caching initiative
+# lookups include it in their cache keys
+_initiative_epoch = 0
+
+# (collection id, repository, epoch) -> (collection, {"by_id": ..., "by_name": ...})
+_INITIATIVE_INDEX: dict[tuple, tuple] = {}
+_initiative_lock = threading.Lock()
+
+
+def get_initiative_epoch() -> int:
+    """Return the current initiative epoch."""
+    return _initiative_epoch
+
+
+def bump_initiative_epoch() -> None:
+    """Invalidate cached initiative lookups after initiatives or focus change."""
+    global _initiative_epoch
+    with _initiative_lock:
+        _initiative_epoch += 1
+
+
+def load_initiative_index(collection, repository: Optional[str]) -> dict[str, dict[str, str]]:
+    """
+    Load initiative id <-> name maps for a repository in one metadata read.
+
+    The maps are reused until the initiative epoch changes, so name lookups
+    on the save and search paths do not query the collection each time.
+
+    Args:
+        collection: ChromaDB collection
+        repository: Optional repository filter (None loads all repositories)
+
+    Returns:
+        Dict with "by_id" (id -> name) and "by_name" (name -> id) maps
+    """
+    key = (id(collection), repository, _initiative_epoch)
+    cached = _INITIATIVE_INDEX.get(key)
+    if cached is not None and cached[0] is collection:
+        return cached[1]
+
+    where_filter = {"type": "initiative"}
+    if repository:
+        where_filter = {"$and": [{"type": "initiative"}, {"repository": repository}]}
+    result = collection.get(where=where_filter, include=["metadatas"])
+
+    index = {"by_id": {}, "by_name": {}}
+    for initiative_id, meta in zip(result["ids"], result["metadatas"]):
+        name = meta.get("name", "")
+        index["by_id"][initiative_id] = name
+        # Keep the first match for duplicate names, like the where lookup did
+        index["by_name"].setdefault(name, initiative_id)
+
+    with _initiative_lock:
+        # Entries from older epochs can no longer be hit
+        for stale_key in [k for k in _INITIATIVE_INDEX if k[2] != _initiative_epoch]:
+            _INITIATIVE_INDEX.pop(stale_key, None)
+        _INITIATIVE_INDEX[key] = (collection, index)
+    return index
+
 
 def find_initiative(
     collection,
@@ -94,13 +154,7 @@ def resolve_initiative_id(
         return initiative
 
     try:
-        where_filter = {"$and": [{"type": "initiative"}, {"name": initiative}]}
-        if repository:
-            where_filter["$and"].append({"repository": repository})
-
-        result = collection.get(where=where_filter, include=[])
-        if result["ids"]:
-            return result["ids"][0]
+        return load_initiative_index(collection, repository)["by_name"].get(initiative)
     except Exception as e:
         logger.warning(f"Failed to resolve initiative: {e}")
 
@@ -132,16 +186,20 @@ def resolve_initiative(
     """
     if initiative:
         # Explicit initiative specified
+        index = load_initiative_index(collection, repository)
         if initiative.startswith("initiative:"):
-            initiative_id = initiative
-            init_data = find_initiative(collection, repository, initiative)
-            initiative_name = init_data["metadata"].get("name", "") if init_data else ""
-            return initiative_id, initiative_name
+            initiative_name = index["by_id"].get(initiative)
+            if initiative_name is None:
+                # IDs are global, so an initiative from another repository
+                # is still valid; fetch its name directly
+                init_data = find_initiative(collection, repository, initiative)
+                initiative_name = init_data["metadata"].get("name", "") if init_data else ""
+            return initiative, initiative_name
         else:
             # Assume it's a name, look up the ID
-            init_data = find_initiative(collection, repository, initiative)
-            if init_data:
-                return init_data["id"], init_data["metadata"].get("name", "")
+            initiative_id = index["by_name"].get(initiative)
+            if initiative_id:
+                return initiative_id, initiative
             return None, None
     else:
         # Use focused initiative
@@ -5,6 +5,9 @@ Shared utilities for memory operations: repository resolution,
 context building, and file hashing.
 """
 
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Callable
@@ -14,10 +17,22 @@ from src.configs.services import get_collection, get_repo_path
 from src.external.git import get_current_branch, get_head_commit
 from src.tools.ingest.walker import compute_file_hash
 from src.tools.initiatives import get_any_focused_repository, get_focused_initiative
-from src.tools.initiatives.utils import resolve_initiative
+from src.tools.initiatives.utils import get_initiative_epoch, resolve_initiative
+from src.utils.secret_scrubber import scrub_secrets
 
 logger = get_logger("tools.memory")
 
+# (collection id, repository, initiative arg, epoch) -> (collection, (id, name))
+_INITIATIVE_CACHE: dict[tuple, tuple] = {}
+_INITIATIVE_CACHE_MAX = 128
+
+# Lookups currently running, so concurrent saves for the same key share one scan
+_INITIATIVE_INFLIGHT: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Scrubs content while the save context (git calls, initiative lookup) is built
+_SCRUB_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scrub")
+
 
 def get_focused_initiative_info(repository: str) -> tuple[Optional[str], Optional[str]]:
     """Get focused initiative (id, name) tuple for resolve_initiative callback."""
@@ -62,6 +77,16 @@ def resolve_repository(repository: Optional[str]) -> str:
     return "global"
 
 
+def scrub_secrets_async(text: str) -> "Future[str]":
+    """
+    Start scrubbing secrets from text on a worker thread.
+
+    Callers submit the content first, build their save context, then take
+    .result() when assembling the document text.
+    """
+    return _SCRUB_POOL.submit(scrub_secrets, text)
+
+
 def build_base_context(
     repository: Optional[str],
     initiative: Optional[str],
@@ -78,6 +103,7 @@ def build_base_context(
         - current_commit: HEAD commit SHA (or None)
         - initiative_id: resolved initiative ID (or None)
         - initiative_name: resolved initiative name (or None)
+        - common_meta: pre-built metadata fields shared by every saved document
     """
     repo = resolve_repository(repository)
     collection = get_collection()
@@ -86,9 +112,7 @@ def build_base_context(
     timestamp = datetime.now(timezone.utc).isoformat()
     current_commit = get_head_commit(repo_path) if repo_path else None
 
-    initiative_id, initiative_name = resolve_initiative(
-        collection, repo, initiative, get_focused_initiative_info
-    )
+    initiative_id, initiative_name = resolve_initiative_cached(collection, repo, initiative)
 
     return {
         "repo": repo,
@@ -99,16 +123,92 @@ def build_base_context(
         "current_commit": current_commit,
         "initiative_id": initiative_id,
         "initiative_name": initiative_name,
+        "common_meta": build_common_metadata(
+            repo, branch, timestamp, current_commit, initiative_id, initiative_name
+        ),
     }
 
 
-def add_common_metadata(metadata: dict, ctx: dict) -> None:
-    """Add common fields to metadata dict from context."""
-    if ctx["current_commit"]:
-        metadata["created_commit"] = ctx["current_commit"]
-    if ctx["initiative_id"]:
-        metadata["initiative_id"] = ctx["initiative_id"]
-        metadata["initiative_name"] = ctx["initiative_name"] or ""
+def resolve_initiative_cached(
+    collection,
+    repository: str,
+    initiative: Optional[str],
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Resolve the initiative for a save, reusing earlier lookups.
+
+    Consecutive saves in a session resolve the same initiative (usually the
+    focused one), so results are cached until initiatives or focus change
+    (see bump_initiative_epoch). Concurrent misses for the same key wait on
+    the first caller's lookup instead of each scanning the collection.
+
+    Args:
+        collection: ChromaDB collection
+        repository: Repository identifier
+        initiative: Initiative ID, name, or None for the focused initiative
+
+    Returns:
+        Tuple of (initiative_id, initiative_name), both may be None
+    """
+    key = (id(collection), repository, initiative, get_initiative_epoch())
+    cached = _INITIATIVE_CACHE.get(key)
+    # The stored collection guards against a reused id() after garbage collection
+    if cached is not None and cached[0] is collection:
+        return cached[1]
+
+    with _inflight_lock:
+        future = _INITIATIVE_INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _INITIATIVE_INFLIGHT[key] = future
+    if not owner:
+        return future.result()
+
+    try:
+        resolved = resolve_initiative(collection, repository, initiative, get_focused_initiative_info)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        if len(_INITIATIVE_CACHE) >= _INITIATIVE_CACHE_MAX:
+            _INITIATIVE_CACHE.clear()
+        _INITIATIVE_CACHE[key] = (collection, resolved)
+        future.set_result(resolved)
+        return resolved
+    finally:
+        with _inflight_lock:
+            _INITIATIVE_INFLIGHT.pop(key, None)
+
+
+def build_common_metadata(
+    repo: str,
+    branch: str,
+    timestamp: str,
+    current_commit: Optional[str],
+    initiative_id: Optional[str],
+    initiative_name: Optional[str],
+) -> dict:
+    """
+    Build the metadata template shared by notes, insights, and session summaries.
+
+    Built once per context so save operations can spread it into their
+    metadata dict and only spell out the fields specific to their type,
+    instead of conditionally mutating it field by field.
+    """
+    common_meta = {
+        "repository": repo,
+        "branch": branch,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "status": "active",
+    }
+    if current_commit:
+        common_meta["created_commit"] = current_commit
+    if initiative_id:
+        common_meta["initiative_id"] = initiative_id
+        common_meta["initiative_name"] = initiative_name or ""
+    return common_meta
 
 
 def compute_file_hashes(files: list[str], repo_path: Optional[str]) -> dict[str, str]:
@@ -118,20 +218,30 @@ def compute_file_hashes(files: list[str], repo_path: Optional[str]) -> dict[str,
         return file_hashes
 
     for file_path in files:
-        full_path = Path(file_path)
-        if not full_path.is_absolute():
-            full_path = Path(repo_path) / file_path
-        if full_path.exists():
-            try:
-                file_hashes[file_path] = compute_file_hash(full_path)
-            except (OSError, IOError) as e:
-                logger.warning(f"Could not hash file {file_path}: {e}")
+        full_path = file_path if os.path.isabs(file_path) else os.path.join(repo_path, file_path)
+        try:
+            # Single stat per file; its size picks the hashing strategy
+            size = os.stat(full_path).st_size
+            file_hashes[file_path] = compute_file_hash(Path(full_path), size=size)
+        except FileNotFoundError:
+            continue
+        except (OSError, IOError) as e:
+            logger.warning(f"Could not hash file {file_path}: {e}")
 
     return file_hashes
 
 
-def update_initiative_timestamp(collection, initiative_id: str, timestamp: str) -> None:
-    """Update an initiative's updated_at timestamp."""
+def get_initiative_timestamp_row(
+    collection,
+    initiative_id: str,
+    timestamp: str,
+) -> Optional[tuple[str, str, dict]]:
+    """
+    Fetch an initiative with its updated_at bumped, ready to batch into an upsert.
+
+    Returns:
+        (id, document, metadata) tuple, or None if the initiative is missing
+    """
     try:
         result = collection.get(
             ids=[initiative_id],
@@ -140,10 +250,51 @@ def update_initiative_timestamp(collection, initiative_id: str, timestamp: str)
         if result["ids"]:
             meta = result["metadatas"][0]
             meta["updated_at"] = timestamp
-            collection.upsert(
-                ids=[initiative_id],
-                documents=[result["documents"][0]],
-                metadatas=[meta],
-            )
+            return initiative_id, result["documents"][0], meta
     except Exception as e:
         logger.warning(f"Failed to update initiative timestamp: {e}")
+    return None
+
+
+def upsert_with_initiative(ctx: dict, doc_id: str, document: str, metadata: dict) -> None:
+    """
+    Upsert a memory document, touching its initiative's updated_at in the same call.
+
+    The initiative row (if tagged) is batched into a single collection.upsert
+    so the save costs one write transaction instead of two.
+    """
+    ids, documents, metadatas = [doc_id], [document], [metadata]
+    if ctx["initiative_id"]:
+        row = get_initiative_timestamp_row(ctx["collection"], ctx["initiative_id"], ctx["timestamp"])
+        if row:
+            ids.append(row[0])
+            documents.append(row[1])
+            metadatas.append(row[2])
+
+    ctx["collection"].upsert(
+        ids=ids,
+        documents=documents,
+        metadatas=metadatas,
+    )
+
+
+def persist_memory(ctx: dict, searcher, doc_id: str, document: str, metadata: dict) -> None:
+    """
+    Write a memory document and bring the search index up to date.
+
+    Tagged saves also rewrite the initiative row, whose indexed metadata is
+    then stale, so they mark the index dirty; untagged saves add just the
+    new document.
+    """
+    upsert_with_initiative(ctx, doc_id, document, metadata)
+    if ctx["initiative_id"]:
+        searcher.mark_dirty()
+    else:
+        searcher.add_document(doc_id, document, metadata)
+
+
+def initiative_ref(ctx: dict) -> Optional[dict]:
+    """Return the {"id", "name"} response block for a tagged save, else None."""
+    if not ctx["initiative_id"]:
+        return None
+    return {"id": ctx["initiative_id"], "name": ctx["initiative_name"]}
@@ -9,14 +9,15 @@ import uuid
 from typing import Literal, Optional
 
 from src.configs import get_logger
-from src.configs.services import get_searcher
-from src.utils.secret_scrubber import scrub_secrets
+from src.configs.services import CONFIG, get_searcher
+from src.storage.write_queue import enqueue_write
 
 from .helpers import (
     build_base_context,
-    add_common_metadata,
     compute_file_hashes,
-    update_initiative_timestamp,
+    initiative_ref,
+    persist_memory,
+    scrub_secrets_async,
 )
 
 logger = get_logger("tools.memory")
@@ -88,6 +89,7 @@ def save_note(
     Returns:
         JSON with note ID and save status
     """
+    scrubbed = scrub_secrets_async(content)
     ctx = build_base_context(repository, initiative)
     logger.info(f"Saving note: title='{title}', repository={ctx['repo']}")
 
@@ -96,42 +98,43 @@ def save_note(
 
         # Build document text
         doc_text = f"{title}\n\n" if title else ""
-        doc_text += scrub_secrets(content)
+        doc_text += scrubbed.result()
 
         metadata = {
+            **ctx["common_meta"],
             "type": "note",
             "title": title or "",
             "tags": json.dumps(tags) if tags else "[]",
-            "repository": ctx["repo"],
-            "branch": ctx["branch"],
-            "created_at": ctx["timestamp"],
-            "updated_at": ctx["timestamp"],
             "verified_at": ctx["timestamp"],
-            "status": "active",
         }
-        add_common_metadata(metadata, ctx)
 
-        ctx["collection"].upsert(
-            ids=[note_id],
-            documents=[doc_text],
-            metadatas=[metadata],
-        )
-        get_searcher().build_index()
-
-        logger.info(f"Note saved: {note_id}")
+        def write_note() -> None:
+            ctx["collection"].upsert(
+                ids=[note_id],
+                documents=[doc_text],
+                metadatas=[metadata],
+            )
+            get_searcher().add_document(note_id, doc_text, metadata)
+
+        async_write = CONFIG.get("async_note_writes", False)
+        if async_write:
+            enqueue_write(write_note)
+            logger.info(f"Note queued: {note_id}")
+        else:
+            write_note()
+            logger.info(f"Note saved: {note_id}")
 
         response = {
             "status": "saved",
             "note_id": note_id,
             "title": title,
         }
+        if async_write:
+            response["write"] = "queued"
         if ctx["initiative_id"]:
-            response["initiative"] = {
-                "id": ctx["initiative_id"],
-                "name": ctx["initiative_name"],
-            }
+            response["initiative"] = initiative_ref(ctx)
 
-        return json.dumps(response, indent=2)
+        return json.dumps(response)
 
     except Exception as e:
         logger.error(f"Note save error: {e}")
@@ -169,6 +172,7 @@ def save_insight(
             "error": "files parameter is required and must be a non-empty list",
         })
 
+    scrubbed = scrub_secrets_async(insight)
     ctx = build_base_context(repository, initiative)
     logger.info(f"Saving insight: title='{title}', files={len(files)}, repository={ctx['repo']}")
 
@@ -177,37 +181,24 @@ def save_insight(
 
         # Build document text
         doc_text = f"{title}\n\n" if title else ""
-        doc_text += scrub_secrets(insight)
+        doc_text += scrubbed.result()
         doc_text += f"\n\nLinked files: {', '.join(files)}"
 
         # Compute file hashes for linked files (for staleness detection)
         file_hashes = compute_file_hashes(files, ctx["repo_path"])
 
         metadata = {
+            **ctx["common_meta"],
             "type": "insight",
             "title": title or "",
             "files": json.dumps(files),
             "tags": json.dumps(tags) if tags else "[]",
-            "repository": ctx["repo"],
-            "branch": ctx["branch"],
-            "created_at": ctx["timestamp"],
-            "updated_at": ctx["timestamp"],
             "verified_at": ctx["timestamp"],
-            "status": "active",
             "file_hashes": json.dumps(file_hashes),
         }
-        add_common_metadata(metadata, ctx)
-
-        # Update initiative's updated_at timestamp if tagged
-        if ctx["initiative_id"]:
-            update_initiative_timestamp(ctx["collection"], ctx["initiative_id"], ctx["timestamp"])
 
-        ctx["collection"].upsert(
-            ids=[insight_id],
-            documents=[doc_text],
-            metadatas=[metadata],
-        )
-        get_searcher().build_index()
+        # Also updates the initiative's updated_at timestamp if tagged
+        persist_memory(ctx, get_searcher(), insight_id, doc_text, metadata)
 
         logger.info(f"Insight saved: {insight_id}")
 
@@ -220,13 +211,10 @@ def save_insight(
             "tags": tags or [],
         }
         if ctx["initiative_id"]:
-            response["initiative"] = {
-                "id": ctx["initiative_id"],
-                "name": ctx["initiative_name"],
-            }
+            response["initiative"] = initiative_ref(ctx)
             response["initiative_name"] = ctx["initiative_name"]
 
-        return json.dumps(response, indent=2)
+        return json.dumps(response)
 
     except Exception as e:
         logger.error(f"Insight save error: {e}")
@@ -10,12 +10,12 @@ from typing import Optional
 
 from src.configs import get_logger
 from src.configs.services import get_searcher
-from src.utils.secret_scrubber import scrub_secrets
 
 from .helpers import (
     build_base_context,
-    add_common_metadata,
-    update_initiative_timestamp,
+    initiative_ref,
+    persist_memory,
+    scrub_secrets_async,
 )
 
 logger = get_logger("tools.memory")
@@ -46,6 +46,7 @@ def conclude_session(
     Returns:
         JSON with session summary status
     """
+    scrubbed = scrub_secrets_async(summary)
     ctx = build_base_context(repository, initiative)
     logger.info(f"Saving session summary to Cortex: {len(changed_files)} files, repository={ctx['repo']}")
 
@@ -53,27 +54,16 @@ def conclude_session(
         doc_id = f"session_summary:{uuid.uuid4().hex[:8]}"
 
         metadata = {
+            **ctx["common_meta"],
             "type": "session_summary",
-            "repository": ctx["repo"],
-            "branch": ctx["branch"],
             "files": json.dumps(changed_files),
-            "created_at": ctx["timestamp"],
-            "updated_at": ctx["timestamp"],
-            "status": "active",
         }
-        add_common_metadata(metadata, ctx)
 
-        # Update initiative's updated_at timestamp if tagged
-        if ctx["initiative_id"]:
-            update_initiative_timestamp(ctx["collection"], ctx["initiative_id"], ctx["timestamp"])
+        doc_text = f"Session Summary:\n\n{scrubbed.result()}\n\nChanged files: {', '.join(changed_files)}"
 
-        ctx["collection"].upsert(
-            ids=[doc_id],
-            documents=[f"Session Summary:\n\n{scrub_secrets(summary)}\n\nChanged files: {', '.join(changed_files)}"],
-            metadatas=[metadata],
-        )
+        # Also updates the initiative's updated_at timestamp if tagged
+        persist_memory(ctx, get_searcher(), doc_id, doc_text, metadata)
         logger.debug(f"Saved session summary: {doc_id}")
-        get_searcher().build_index()
 
         logger.info(f"Session summary complete: {doc_id}")
 
@@ -89,14 +79,13 @@ def conclude_session(
             completion_detected = detect_completion_signals(summary)
 
             response["initiative"] = {
-                "id": ctx["initiative_id"],
-                "name": ctx["initiative_name"],
+                **initiative_ref(ctx),
                 "completion_signal_detected": completion_detected,
             }
             if completion_detected:
                 response["initiative"]["prompt"] = "mark_complete"
 
-        return json.dumps(response, indent=2)
+        return json.dumps(response)
 
     except Exception as e:
         logger.error(f"Session summary error: {e}")
@@ -55,10 +55,10 @@ def validate_insight(
         repo_path = get_repo_path()
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Fetch the insight
+        # Fetch the insight (metadata only - the document is never rewritten)
         result = collection.get(
             ids=[insight_id],
-            include=["documents", "metadatas"],
+            include=["metadatas"],
         )
 
         if not result["ids"]:
@@ -68,7 +68,6 @@ def validate_insight(
             })
 
         meta = result["metadatas"][0]
-        doc = result["documents"][0]
 
         # Verify it's actually an insight
         if meta.get("type") != "insight":
@@ -127,7 +126,7 @@ def validate_insight(
 
             if linked_files and repo_path:
                 new_hashes = compute_file_hashes(linked_files, repo_path)
-                if new_hashes:
+                if new_hashes and new_hashes != json.loads(meta.get("file_hashes", "{}")):
                     meta["file_hashes"] = json.dumps(new_hashes)
                     response["file_hashes_refreshed"] = True
 
@@ -138,17 +137,16 @@ def validate_insight(
 
             logger.info(f"Validated insight as still valid: {insight_id}")
 
-        # Save updated metadata
-        collection.upsert(
+        # Save updated metadata (metadata-only update skips re-embedding)
+        collection.update(
             ids=[insight_id],
-            documents=[doc],
             metadatas=[meta],
         )
 
-        # Rebuild search index
-        get_searcher().build_index()
+        # Schedule a debounced search index rebuild
+        get_searcher().mark_dirty()
 
-        return json.dumps(response, indent=2)
+        return json.dumps(response)
 
     except Exception as e:
         logger.error(f"Validate insight error: {e}")
@@ -113,6 +113,7 @@ def _check_ghcr_latest() -> Optional[dict]:
             token_url,
             headers={"User-Agent": "Cortex"},
             timeout=5,
+            cache=True,
         )
 
         if not token_data or "token" not in token_data:
@@ -130,6 +131,7 @@ def _check_ghcr_latest() -> Optional[dict]:
                 "User-Agent": "Cortex",
             },
             timeout=5,
+            cache=True,
         )
 
         if not tags_data or "tags" not in tags_data:
@@ -5,6 +5,7 @@ Hybrid search with BM25, vector similarity, RRF fusion, and reranking.
 """
 
 from src.tools.search.bm25 import BM25Index, tokenize_code
+from src.tools.search.cache import bump_search_epoch, clear_search_cache
 from src.tools.search.filters import (
     INITIATIVE_BOOST_FACTOR,
     apply_initiative_boost,
@@ -40,4 +41,7 @@ __all__ = [
     "INITIATIVE_BOOST_FACTOR",
     # Pipeline
     "SearchPipeline",
+    # Response cache
+    "bump_search_epoch",
+    "clear_search_cache",
 ]
@@ -4,12 +4,13 @@ BM25 Keyword Search
 BM25 index for keyword-based search with code-aware tokenization.
 """
 
+import math
 import re
 import time
+from collections import Counter
 from typing import Any, Optional
 
 import chromadb
-from rank_bm25 import BM25Okapi
 
 from src.configs import get_logger
 
@@ -46,13 +47,80 @@ def tokenize_code(text: str) -> list[str]:
     return tokens
 
 
+class BM25Postings:
+    """
+    Okapi BM25 statistics kept as posting lists so documents can be appended.
+
+    Scores match rank_bm25's BM25Okapi (same k1, b and epsilon IDF floor).
+    Adding a document touches only its own terms; IDF is derived from the
+    posting list lengths at query time.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self.doc_lens: list[int] = []
+        self.avgdl = 0.0
+        self._total_len = 0
+        # Mean IDF over the vocabulary, only needed for the negative-IDF floor
+        self._average_idf: Optional[float] = None
+
+    @property
+    def corpus_size(self) -> int:
+        return len(self.doc_lens)
+
+    def add(self, tokens: list[str]) -> None:
+        """Append a tokenized document to the posting lists."""
+        position = len(self.doc_lens)
+        for token, tf in Counter(tokens).items():
+            self.postings.setdefault(token, []).append((position, tf))
+        self.doc_lens.append(len(tokens))
+        self._total_len += len(tokens)
+        self.avgdl = self._total_len / len(self.doc_lens)
+        self._average_idf = None
+
+    def _raw_idf(self, doc_freq: int) -> float:
+        n = len(self.doc_lens)
+        return math.log(n - doc_freq + 0.5) - math.log(doc_freq + 0.5)
+
+    def idf(self, token: str) -> float:
+        """IDF for a token, floored at epsilon * mean IDF like BM25Okapi."""
+        postings = self.postings.get(token)
+        if not postings:
+            return 0.0
+        value = self._raw_idf(len(postings))
+        if value < 0:
+            if self._average_idf is None:
+                self._average_idf = sum(
+                    self._raw_idf(len(p)) for p in self.postings.values()
+                ) / len(self.postings)
+            value = self.epsilon * self._average_idf
+        return value
+
+    def get_scores(self, tokens: list[str]) -> list[float]:
+        """Score every document against the query tokens."""
+        scores = [0.0] * len(self.doc_lens)
+        for token in tokens:
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = self.idf(token)
+            for position, tf in postings:
+                norm = 1 - self.b + self.b * self.doc_lens[position] / self.avgdl
+                scores[position] += idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+        return scores
+
+
 class BM25Index:
     """BM25 keyword index for hybrid search."""
 
     def __init__(self):
-        self.index: Optional[BM25Okapi] = None
+        self.index: Optional[BM25Postings] = None
         self.documents: list[dict[str, Any]] = []
         self.doc_ids: list[str] = []
+        self._id_set: set[str] = set()
 
     def build_from_collection(
         self,
@@ -76,10 +144,18 @@ class BM25Index:
             self.index = None
             self.documents = []
             self.doc_ids = []
+            self._id_set = set()
             logger.debug("BM25 index: empty collection")
             return
 
+        # Tokenize for BM25 (using code-aware tokenizer)
+        index = BM25Postings()
+        for doc in results["documents"]:
+            index.add(tokenize_code(doc))
+
+        self.index = index
         self.doc_ids = results["ids"]
+        self._id_set = set(self.doc_ids)
         self.documents = [
             {"id": doc_id, "text": doc, "meta": meta}
             for doc_id, doc, meta in zip(
@@ -88,13 +164,35 @@ class BM25Index:
                 results["metadatas"],
             )
         ]
-
-        # Tokenize for BM25 (using code-aware tokenizer)
-        tokenized = [tokenize_code(doc) for doc in results["documents"]]
-        self.index = BM25Okapi(tokenized)
         elapsed = time.time() - start_time
         logger.debug(f"BM25 index built: {len(self.documents)} docs in {elapsed*1000:.1f}ms")
 
+    def add(self, doc_id: str, text: str, meta: dict[str, Any]) -> bool:
+        """
+        Add a single new document without re-tokenizing the rest of the corpus.
+
+        Not safe to call concurrently with search(); callers serialize access.
+
+        Args:
+            doc_id: Document ID
+            text: Document text
+            meta: Document metadata
+
+        Returns:
+            True if the document was added, False if it is already indexed
+            (replacing it needs a full rebuild)
+        """
+        if doc_id in self._id_set:
+            return False
+
+        if self.index is None:
+            self.index = BM25Postings()
+        self.index.add(tokenize_code(text))
+        self.doc_ids.append(doc_id)
+        self._id_set.add(doc_id)
+        self.documents.append({"id": doc_id, "text": text, "meta": meta})
+        return True
+
     def search(self, query: str, top_k: int = 50) -> list[dict[str, Any]]:
         """
         Search using BM25 and return scored documents.
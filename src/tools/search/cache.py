@@ -0,0 +1,78 @@
+"""
+Search Response Cache
+
+Short-lived LRU cache for search responses. Agents often repeat the same
+query while iterating, and a hit skips retrieval, reranking and the
+context fetches entirely.
+
+Entries are keyed on the search arguments plus a write epoch. Every write
+to Cortex memory bumps the epoch, so earlier entries can no longer be hit
+and simply age out of the LRU.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+SEARCH_CACHE_TTL_SECONDS = 60.0
+SEARCH_CACHE_MAX_ENTRIES = 256
+
+_SEARCH_CACHE: "OrderedDict[tuple, tuple[float, str]]" = OrderedDict()
+_search_epoch = 0
+_cache_lock = Lock()
+
+
+def get_search_epoch() -> int:
+    """Return the current write epoch."""
+    return _search_epoch
+
+
+def bump_search_epoch() -> None:
+    """Invalidate all cached search responses after a write."""
+    global _search_epoch
+    with _cache_lock:
+        _search_epoch += 1
+
+
+def get_cached_search(key: tuple) -> Optional[str]:
+    """
+    Look up a cached search response.
+
+    Args:
+        key: Cache key (should include the epoch from get_search_epoch())
+
+    Returns:
+        Cached JSON response, or None on miss or expiry
+    """
+    with _cache_lock:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is None:
+            return None
+        cached_at, response = entry
+        if time.monotonic() - cached_at > SEARCH_CACHE_TTL_SECONDS:
+            del _SEARCH_CACHE[key]
+            return None
+        _SEARCH_CACHE.move_to_end(key)
+        return response
+
+
+def cache_search(key: tuple, response: str) -> None:
+    """
+    Store a search response, evicting the least recently used entry if full.
+
+    Args:
+        key: Cache key
+        response: JSON response to cache
+    """
+    with _cache_lock:
+        _SEARCH_CACHE[key] = (time.monotonic(), response)
+        _SEARCH_CACHE.move_to_end(key)
+        while len(_SEARCH_CACHE) > SEARCH_CACHE_MAX_ENTRIES:
+            _SEARCH_CACHE.popitem(last=False)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search responses."""
+    with _cache_lock:
+        _SEARCH_CACHE.clear()
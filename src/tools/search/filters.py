@@ -4,6 +4,7 @@ Search Filters and Initiative Boosting
 ChromaDB filter builders and initiative-aware result filtering/boosting.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from src.configs import get_logger
@@ -26,6 +27,9 @@ def build_branch_aware_filter(
 
     Notes, session_summaries, tech_stack, initiatives are never filtered by branch.
 
+    Filters are memoized per (repository, branches, types), so the returned
+    dict is shared between calls: copy it before mutating.
+
     Args:
         repository: Optional repository filter
         branches: List of branches to include for code/skeleton
@@ -34,6 +38,20 @@ def build_branch_aware_filter(
     Returns:
         ChromaDB where filter dict, or None if no filtering needed
     """
+    return _build_branch_aware_filter(
+        repository,
+        tuple(branches) if branches else None,
+        tuple(types) if types else None,
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_branch_aware_filter(
+    repository: Optional[str],
+    branches: Optional[tuple[str, ...]],
+    types: Optional[tuple[str, ...]],
+) -> Optional[dict]:
+    """Cached implementation of build_branch_aware_filter (hashable arguments)."""
     # If explicit types requested, build type-aware filter
     if types:
         # Separate branch-filtered types from cross-branch types
@@ -41,14 +59,14 @@ def build_branch_aware_filter(
         non_branch_types = [t for t in types if t not in BRANCH_FILTERED_TYPES]
 
         # Build type filter with proper branch handling
-        if branch_types and branches and branches != ["unknown"]:
+        if branch_types and branches and branches != ("unknown",):
             # Mix of branch-filtered and non-branch types
             conditions = []
             if branch_types:
                 conditions.append({
                     "$and": [
                         {"type": {"$in": branch_types}},
-                        {"branch": {"$in": branches}}
+                        {"branch": {"$in": list(branches)}}
                     ]
                 })
             if non_branch_types:
@@ -57,14 +75,14 @@ def build_branch_aware_filter(
             type_filter = {"$or": conditions} if len(conditions) > 1 else conditions[0]
         else:
             # Only non-branch types, or no branch filtering needed
-            type_filter = {"type": {"$in": types}}
+            type_filter = {"type": {"$in": list(types)}}
 
         if repository:
             return {"$and": [{"repository": repository}, type_filter]}
         return type_filter
 
     # No type filter: use existing branch-aware logic
-    if not branches or branches == ["unknown"]:
+    if not branches or branches == ("unknown",):
         # No branch filtering if unknown
         return {"repository": repository} if repository else None
 
@@ -75,7 +93,7 @@ def build_branch_aware_filter(
             # Code/metadata types: filter by branch
             {"$and": [
                 {"type": {"$in": list(BRANCH_FILTERED_TYPES)}},
-                {"branch": {"$in": branches}}
+                {"branch": {"$in": list(branches)}}
             ]},
             # Semantic memory types: always include (cross-branch)
             {"type": {"$in": ["note", "session_summary", "tech_stack", "initiative", "insight"]}}
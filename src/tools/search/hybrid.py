@@ -6,16 +6,20 @@ Combines vector search and BM25 using Reciprocal Rank Fusion.
 
 import json
 import time
-from threading import RLock
+from threading import RLock, Timer
 from typing import Any, Optional
 
 import chromadb
 
 from src.configs import get_logger
 from src.tools.search.bm25 import BM25Index
+from src.tools.search.cache import bump_search_epoch
 
 logger = get_logger("search.hybrid")
 
+# Quiet period after the last write before a dirty BM25 index is rebuilt
+REBUILD_DEBOUNCE_SECONDS = 0.5
+
 
 def _filter_hash(where_filter: Optional[dict]) -> str:
     """Create a hashable representation of a filter for comparison."""
@@ -25,6 +29,49 @@ def _filter_hash(where_filter: Optional[dict]) -> str:
     return json.dumps(where_filter, sort_keys=True)
 
 
+def _matches_filter(meta: dict[str, Any], where_filter: Optional[dict]) -> Optional[bool]:
+    """
+    Evaluate a ChromaDB where filter against a metadata dict.
+
+    Supports the operators produced by build_branch_aware_filter ($and, $or,
+    $eq, $ne, $in, $nin and plain equality).
+
+    Returns:
+        True/False for a match, or None if the filter uses anything else
+    """
+    if where_filter is None:
+        return True
+
+    results = []
+    for key, condition in where_filter.items():
+        if key in ("$and", "$or"):
+            sub_results = [_matches_filter(meta, sub) for sub in condition]
+            if None in sub_results:
+                return None
+            results.append(all(sub_results) if key == "$and" else any(sub_results))
+        elif key.startswith("$"):
+            return None
+        elif isinstance(condition, dict):
+            if len(condition) != 1:
+                return None
+            op, operand = next(iter(condition.items()))
+            value = meta.get(key)
+            if op == "$eq":
+                results.append(value == operand)
+            elif op == "$ne":
+                results.append(value != operand)
+            elif op == "$in":
+                results.append(value in operand)
+            elif op == "$nin":
+                results.append(value not in operand)
+            else:
+                return None
+        else:
+            results.append(meta.get(key) == condition)
+
+    return all(results)
+
+
 def reciprocal_rank_fusion(
     vector_results: list[dict[str, Any]],
     bm25_results: list[dict[str, Any]],
@@ -78,14 +125,70 @@ class HybridSearcher:
         self.bm25_index = BM25Index()
         self._index_built = False
         self._index_filter_hash = ""
+        self._index_filter: Optional[dict] = None
         self._index_lock = RLock()
+        self._rebuild_timer: Optional[Timer] = None
 
     def invalidate(self) -> None:
         """Mark the BM25 index as stale, requiring rebuild on next search."""
+        bump_search_epoch()
         with self._index_lock:
             self._index_built = False
             self._index_filter_hash = ""
 
+    def mark_dirty(self) -> None:
+        """
+        Mark the BM25 index as stale and schedule a debounced rebuild.
+
+        Bursts of writes collapse into a single background rebuild once no
+        write has happened for REBUILD_DEBOUNCE_SECONDS. The rebuild reuses
+        the filter of the last built index, so the next search with the same
+        filter does not rebuild again. A search that arrives first rebuilds
+        synchronously as it would after invalidate().
+        """
+        bump_search_epoch()
+        with self._index_lock:
+            self._index_built = False
+            if self._rebuild_timer is not None:
+                self._rebuild_timer.cancel()
+            self._rebuild_timer = Timer(REBUILD_DEBOUNCE_SECONDS, self._rebuild_if_dirty)
+            self._rebuild_timer.daemon = True
+            self._rebuild_timer.start()
+
+    def add_document(self, doc_id: str, text: str, meta: dict[str, Any]) -> None:
+        """
+        Add a newly written document to the BM25 index incrementally.
+
+        Only the new document is tokenized. Falls back to mark_dirty() when
+        the index is stale, the document already exists, or the index filter
+        cannot be evaluated against the document's metadata.
+
+        Args:
+            doc_id: Document ID
+            text: Document text
+            meta: Document metadata
+        """
+        bump_search_epoch()
+        with self._index_lock:
+            if self._index_built and self._rebuild_timer is None:
+                matches = _matches_filter(meta, self._index_filter)
+                if matches is False:
+                    return
+                if matches and self.bm25_index.add(doc_id, text, meta):
+                    return
+        self.mark_dirty()
+
+    def _rebuild_if_dirty(self) -> None:
+        """Timer callback: rebuild the index unless a search already did."""
+        with self._index_lock:
+            self._rebuild_timer = None
+            if self._index_built:
+                return
+            try:
+                self.build_index(self._index_filter)
+            except Exception as e:
+                logger.warning(f"Debounced BM25 index rebuild failed: {e}")
+
     def build_index(self, where_filter: Optional[dict] = None) -> None:
         """
         Build/rebuild the BM25 index.
@@ -93,10 +196,12 @@ class HybridSearcher:
         Args:
             where_filter: Optional filter for documents
         """
+        bump_search_epoch()
         with self._index_lock:
             self.bm25_index.build_from_collection(self.collection, where_filter)
             self._index_built = True
             self._index_filter_hash = _filter_hash(where_filter)
+            self._index_filter = where_filter
 
     def search(
         self,
@@ -127,6 +232,7 @@ class HybridSearcher:
                 self.bm25_index.build_from_collection(self.collection, where_filter)
                 self._index_built = True
                 self._index_filter_hash = current_filter_hash
+                self._index_filter = where_filter
 
         # Vector search
         vector_start = time.time()
@@ -157,9 +263,10 @@ class HybridSearcher:
                 )
         logger.debug(f"Vector search: {len(formatted_vector)} results in {vector_time*1000:.1f}ms")
 
-        # BM25 search
+        # BM25 search (under the lock: add_document() updates the index in place)
         bm25_start = time.time()
-        bm25_results = self.bm25_index.search(query, top_k=top_k)
+        with self._index_lock:
+            bm25_results = self.bm25_index.search(query, top_k=top_k)
         bm25_time = time.time() - bm25_start
         logger.debug(f"BM25 search: {len(bm25_results)} results in {bm25_time*1000:.1f}ms")
 
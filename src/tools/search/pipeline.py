@@ -7,14 +7,17 @@ boosting, staleness checks, and result formatting.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
 from src.configs import get_logger
 from src.configs.services import CONFIG, get_collection, get_reranker, get_repo_path, get_searcher
 from src.external.git import get_current_branch
+from src.storage.write_queue import flush_writes
 from src.tools.initiatives.focus import get_focus_id
 from src.tools.initiatives.utils import resolve_initiative_id
+from src.tools.search.cache import cache_search, get_cached_search, get_search_epoch
 from src.tools.search.filters import apply_initiative_boost, build_branch_aware_filter, filter_by_initiative
 from src.tools.search.recency import apply_recency_boost
 from src.tools.search.type_scoring import apply_type_boost
@@ -22,6 +25,19 @@ from src.tools.search.staleness import check_insight_staleness, check_note_stale
 
 logger = get_logger("search.pipeline")
 
+# Result content is cut to this many characters. Slicing a shorter string
+# returns the same object in CPython, so only long texts are copied.
+MAX_RESULT_CONTENT_CHARS = 2000
+
+# Runs independent collection reads (skeleton vs. tech_stack/initiative) concurrently
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search-io")
+
+# Skeleton and tech_stack/initiative context only change on writes, so they are
+# reused across different queries for the same repository until the epoch moves
+REPO_CONTEXT_TTL_SECONDS = 60.0
+_REPO_CONTEXT_CACHE: dict[tuple, tuple[float, tuple[Optional[dict], Optional[dict]]]] = {}
+_REPO_CONTEXT_CACHE_MAX = 64
+
 
 @dataclass
 class SearchPipeline:
@@ -43,6 +59,7 @@ class SearchPipeline:
     initiative: Optional[str] = None
     include_completed: bool = True
     types: Optional[list[str]] = None
+    include_context: bool = True
 
     # Resolved context (set during execution)
     _collection: object = field(default=None, repr=False)
@@ -67,6 +84,9 @@ class SearchPipeline:
         start_time = time.time()
 
         try:
+            # Read our own writes: apply any queued note saves first
+            flush_writes()
+
             # Initialize resources
             self._collection = get_collection()
             searcher = get_searcher()
@@ -74,17 +94,26 @@ class SearchPipeline:
 
             # Phase 1: Resolve context
             self._resolve_branch_context()
+
+            cache_key = self._cache_key()
+            cached = get_cached_search(cache_key)
+            if cached is not None:
+                logger.info(f"Search complete: cache hit in {(time.time() - start_time)*1000:.1f}ms")
+                return cached
+
             self._resolve_initiative_context()
 
             # Phase 2: Execute hybrid search
             candidates = self._execute_search(searcher)
             if not candidates:
                 logger.info("Search: no candidates found")
-                return json.dumps({
+                response_json = json.dumps({
                     "query": self.query,
                     "results": [],
                     "message": "No results found. Try ingesting code first with ingest_code_into_cortex.",
                 })
+                cache_search(cache_key, response_json)
+                return response_json
 
             # Phase 3: Apply ranking
             ranked = self._apply_ranking(reranker, candidates)
@@ -92,10 +121,11 @@ class SearchPipeline:
             # Phase 4: Format results with staleness checks
             results, verification_count = self._format_results(ranked)
 
-            # Phase 5: Fetch additional context
+            # Phase 5: Fetch additional context (unless the caller opted out)
+            skeleton_data, context_data = None, None
             detected_repo = self._detect_repository(results)
-            skeleton_data = self._fetch_skeleton(detected_repo)
-            context_data = self._fetch_context(detected_repo)
+            if self.include_context and detected_repo:
+                skeleton_data, context_data = self._fetch_repository_context(detected_repo)
 
             # Build response
             response = self._build_response(
@@ -105,7 +135,9 @@ class SearchPipeline:
             total_time = time.time() - start_time
             logger.info(f"Search complete: {len(results)} results in {total_time*1000:.1f}ms")
 
-            return json.dumps(response, indent=2)
+            response_json = json.dumps(response)
+            cache_search(cache_key, response_json)
+            return response_json
 
         except Exception as e:
             logger.error(f"Search error: {e}")
@@ -126,6 +158,20 @@ class SearchPipeline:
 
         logger.debug(f"Branch filter: effective={self._effective_branch}, branches={self._branches}")
 
+    def _cache_key(self) -> tuple:
+        """Build the response cache key from the arguments and resolved branches."""
+        return (
+            self.query,
+            self.repository,
+            self.min_score,
+            tuple(self._branches),
+            self.initiative,
+            self.include_completed,
+            tuple(self.types) if self.types else None,
+            self.include_context,
+            get_search_epoch(),
+        )
+
     def _resolve_initiative_context(self) -> None:
         """Resolve initiative filtering and boosting context."""
         if self.initiative:
@@ -198,9 +244,12 @@ class SearchPipeline:
             logger.debug(f"Initiative boost applied for focused: {self._focused_initiative_id}")
 
         # Apply minimum score filter
+        # Resolve each result's score once so the filter and the response agree
+        # (any boost sets boosted_score, not just the recency boost)
+        for r in ranked:
+            r["final_score"] = r.get("boosted_score", r.get("rerank_score", 0.0))
         threshold = self.min_score if self.min_score is not None else CONFIG["min_score"]
-        score_key = "boosted_score" if CONFIG["recency_boost"] else "rerank_score"
-        filtered = [r for r in ranked if r.get(score_key, r.get("rerank_score", 0)) >= threshold]
+        filtered = [r for r in ranked if r["final_score"] >= threshold]
         logger.debug(f"Score filter (>={threshold}): {len(filtered)} results")
 
         # Log top results
@@ -233,10 +282,10 @@ class SearchPipeline:
         """Format a single search result."""
         meta = r.get("meta", {})
         doc_type = meta.get("type", "")
-        final_score = r.get("boosted_score", r.get("rerank_score", 0))
+        final_score = r["final_score"]
 
         result = {
-            "content": r.get("text", "")[:2000],
+            "content": r.get("text", "")[:MAX_RESULT_CONTENT_CHARS],
             "file_path": meta.get("file_path", "unknown"),
             "repository": meta.get("repository", "unknown"),
             "branch": meta.get("branch", "unknown"),
@@ -290,35 +339,49 @@ class SearchPipeline:
             detected = results[0].get("repository")
         return detected if detected and detected != "unknown" else None
 
+    def _fetch_repository_context(self, repo: str) -> tuple[Optional[dict], Optional[dict]]:
+        """Fetch (skeleton, context) for a repository, reusing recent lookups."""
+        key = (repo, tuple(self._branches), get_search_epoch())
+        cached = _REPO_CONTEXT_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] <= REPO_CONTEXT_TTL_SECONDS:
+            return cached[1]
+
+        # Both reads in parallel
+        skeleton_future = _IO_POOL.submit(self._fetch_skeleton, repo)
+        context_data = self._fetch_context(repo)
+        data = (skeleton_future.result(), context_data)
+
+        if len(_REPO_CONTEXT_CACHE) >= _REPO_CONTEXT_CACHE_MAX:
+            _REPO_CONTEXT_CACHE.clear()
+        _REPO_CONTEXT_CACHE[key] = (time.monotonic(), data)
+        return data
+
     def _fetch_skeleton(self, repo: Optional[str]) -> Optional[dict]:
         """Fetch repository skeleton."""
         if not repo:
             return None
 
         try:
-            # Try to get skeleton for current branch first
+            # One read for every skeleton of this repository (one per indexed
+            # branch); prefer the current branch, else fall back to any
             skeleton_results = self._collection.get(
-                where={"$and": [
-                    {"type": "skeleton"},
-                    {"repository": repo},
-                    {"branch": {"$in": self._branches}},
-                ]},
+                where={"$and": [{"type": "skeleton"}, {"repository": repo}]},
                 include=["documents", "metadatas"],
             )
-            # Fallback to any skeleton for this repository if branch-specific not found
-            if not skeleton_results["documents"]:
-                skeleton_results = self._collection.get(
-                    where={"$and": [{"type": "skeleton"}, {"repository": repo}]},
-                    include=["documents", "metadatas"],
+            docs = skeleton_results["documents"]
+            if docs:
+                metas = skeleton_results["metadatas"]
+                idx = next(
+                    (i for i, m in enumerate(metas) if m.get("branch") in self._branches),
+                    0,
                 )
-            if skeleton_results["documents"]:
-                skel_meta = skeleton_results["metadatas"][0]
+                skel_meta = metas[idx]
                 skeleton_data = {
                     "repository": repo,
                     "branch": skel_meta.get("branch", "unknown"),
                     "total_files": skel_meta.get("total_files", 0),
                     "total_dirs": skel_meta.get("total_dirs", 0),
-                    "tree": skeleton_results["documents"][0],
+                    "tree": docs[idx],
                 }
                 logger.debug(
                     f"Skeleton included: {skel_meta.get('total_files', 0)} files "
@@ -342,23 +405,26 @@ class SearchPipeline:
                 ids=[tech_stack_id, initiative_id],
                 include=["documents", "metadatas"],
             )
-            if context_results["documents"]:
+            ids = context_results.get("ids") or []
+            docs = context_results.get("documents") or []
+            metas = context_results.get("metadatas") or [{}] * len(ids)
+            by_id = dict(zip(ids, zip(docs, metas)))
+
+            if by_id:
                 context_data = {"repository": repo}
-                for i, doc_id in enumerate(context_results.get("ids", [])):
-                    if i < len(context_results.get("documents", [])):
-                        doc = context_results["documents"][i]
-                        meta = context_results["metadatas"][i] if context_results.get("metadatas") else {}
-                        if doc_id == tech_stack_id:
-                            context_data["tech_stack"] = {
-                                "content": doc,
-                                "updated_at": meta.get("updated_at", "unknown"),
-                            }
-                        elif doc_id == initiative_id:
-                            context_data["initiative"] = {
-                                "name": meta.get("initiative_name", ""),
-                                "status": meta.get("initiative_status", ""),
-                                "updated_at": meta.get("updated_at", "unknown"),
-                            }
+                if tech_stack_id in by_id:
+                    doc, meta = by_id[tech_stack_id]
+                    context_data["tech_stack"] = {
+                        "content": doc,
+                        "updated_at": meta.get("updated_at", "unknown"),
+                    }
+                if initiative_id in by_id:
+                    _, meta = by_id[initiative_id]
+                    context_data["initiative"] = {
+                        "name": meta.get("initiative_name", ""),
+                        "status": meta.get("initiative_status", ""),
+                        "updated_at": meta.get("updated_at", "unknown"),
+                    }
                 if not context_data.get("tech_stack") and not context_data.get("initiative"):
                     return None
                 logger.debug(
@@ -22,6 +22,7 @@ def search_cortex(
     include_completed: bool = True,
     types: Optional[list[str]] = None,
     preset: Optional[str] = None,
+    include_context: bool = True,
 ) -> str:
     """
     Search the Cortex memory for relevant code, documentation, or notes.
@@ -45,6 +46,9 @@ def search_cortex(
                - "structure": file_metadata, dependencies, skeleton
                - "trace": entry_points, dependencies, data_contracts (debugging)
                - "memory": all semantic memory types
+        include_context: Include the repository skeleton and tech_stack/initiative
+               context in the response (default: True). Pass False when only the
+               ranked results are needed.
 
     Returns:
         JSON with search results including content, file paths, and scores
@@ -75,5 +79,6 @@ def search_cortex(
         initiative=initiative,
         include_completed=include_completed,
         types=types,
+        include_context=include_context,
     )
     return pipeline.execute()
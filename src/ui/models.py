@@ -3,10 +3,15 @@ Data models for the Cortex browser.
 """
 
 from dataclasses import dataclass, field
+from sys import intern
+from types import MappingProxyType
 from typing import Any, Optional
 
+# Read-only stand-in for missing nested objects that are only read from
+_EMPTY = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True)
 class Stats:
     """Collection statistics."""
     total_documents: int
@@ -18,13 +23,25 @@ class Stats:
     def from_dict(cls, data: dict[str, Any]) -> "Stats":
         return cls(
             total_documents=data.get("total_documents", 0),
-            by_repository=data.get("by_repository", {}),
-            by_type=data.get("by_type", {}),
-            by_language=data.get("by_language", {}),
+            by_repository=_interned_counts(data.get("by_repository")),
+            by_type=_interned_counts(data.get("by_type")),
+            by_language=_interned_counts(data.get("by_language")),
         )
 
 
-@dataclass
+def _interned_counts(counts: Optional[dict[str, int]]) -> dict[str, int]:
+    """
+    Copy of a stats breakdown with interned keys.
+
+    Stats are kept as long-lived browser state and the same repository,
+    type, and language names recur on every refresh.
+    """
+    if not counts:
+        return {}
+    return {intern(k): v for k, v in counts.items()}
+
+
+@dataclass(slots=True)
 class DocumentSummary:
     """Summary of a document for list display."""
     id: str
@@ -39,7 +56,7 @@ class DocumentSummary:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DocumentSummary":
-        meta = data.get("metadata", {})
+        meta = data.get("metadata") or _EMPTY
         return cls(
             id=data.get("id", ""),
             doc_type=meta.get("type", "unknown"),
@@ -52,25 +69,23 @@ class DocumentSummary:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Full document with content."""
     id: str
     content: str
     metadata: dict[str, Any]
     has_embedding: bool = False
+    # Derived from metadata once at construction; metadata is treated as
+    # read-only afterwards (use dataclasses.replace to change it)
+    doc_type: str = field(init=False, repr=False, compare=False)
+    repository: str = field(init=False, repr=False, compare=False)
+    title: Optional[str] = field(init=False, repr=False, compare=False)
 
-    @property
-    def doc_type(self) -> str:
-        return self.metadata.get("type", "unknown")
-
-    @property
-    def repository(self) -> str:
-        return self.metadata.get("repository", "unknown")
-
-    @property
-    def title(self) -> Optional[str]:
-        return self.metadata.get("title")
+    def __post_init__(self) -> None:
+        self.doc_type = self.metadata.get("type", "unknown")
+        self.repository = self.metadata.get("repository", "unknown")
+        self.title = self.metadata.get("title")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Document":
@@ -82,7 +97,7 @@ class Document:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultScores:
     """Scores from search."""
     rrf: Optional[float] = None
@@ -100,30 +115,28 @@ class SearchResultScores:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A single search result."""
     id: str
     content_preview: str
     metadata: dict[str, Any]
     scores: SearchResultScores
-
-    @property
-    def doc_type(self) -> str:
-        return self.metadata.get("type", "unknown")
-
-    @property
-    def title(self) -> Optional[str]:
-        return self.metadata.get("title")
-
-    @property
-    def best_score(self) -> float:
-        """Return the best available score for sorting/display."""
+    # Derived once at construction, like Document's
+    doc_type: str = field(init=False, repr=False, compare=False)
+    title: Optional[str] = field(init=False, repr=False, compare=False)
+    # Best available score for sorting/display
+    best_score: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.doc_type = self.metadata.get("type", "unknown")
+        self.title = self.metadata.get("title")
         if self.scores.rerank is not None:
-            return self.scores.rerank
-        if self.scores.rrf is not None:
-            return self.scores.rrf
-        return 0.0
+            self.best_score = self.scores.rerank
+        elif self.scores.rrf is not None:
+            self.best_score = self.scores.rrf
+        else:
+            self.best_score = 0.0
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SearchResult":
@@ -131,11 +144,11 @@ class SearchResult:
             id=data.get("id", ""),
             content_preview=data.get("content_preview", ""),
             metadata=data.get("metadata", {}),
-            scores=SearchResultScores.from_dict(data.get("scores", {})),
+            scores=SearchResultScores.from_dict(data.get("scores") or _EMPTY),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResponse:
     """Response from a search query."""
     query: str
@@ -147,7 +160,7 @@ class SearchResponse:
     def from_dict(cls, data: dict[str, Any]) -> "SearchResponse":
         return cls(
             query=data.get("query", ""),
-            results=[SearchResult.from_dict(r) for r in data.get("results", [])],
-            timing_ms=data.get("timing", {}).get("total_ms", 0),
+            results=list(map(SearchResult.from_dict, data.get("results") or ())),
+            timing_ms=(data.get("timing") or _EMPTY).get("total_ms", 0),
             result_count=data.get("result_count", 0),
         )
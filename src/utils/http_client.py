@@ -3,6 +3,9 @@ Standardized HTTP Client Utilities
 
 Provides a consistent interface for making HTTP requests across Cortex.
 Uses `requests` for synchronous calls with standardized error handling.
+Requests share one pooled session, so repeated calls to the same host
+(LLM providers, the summarizer proxy) reuse TCP/TLS connections, and
+http_json_get can answer repeat requests from a short-lived cache.
 
 Usage:
     from src.utils.http_client import http_get, http_post
@@ -19,12 +22,18 @@ Usage:
     )
 """
 
+import atexit
+import json as jsonlib
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.configs.constants import get_timeout
-from src.exceptions import HTTPConnectionError, HTTPRequestError, HTTPTimeoutError
+from src.exceptions import ClientError, HTTPConnectionError, HTTPRequestError, HTTPTimeoutError
 
 # Default timeout for HTTP requests (seconds)
 DEFAULT_TIMEOUT = get_timeout("http_default", 10)
@@ -32,32 +41,82 @@ DEFAULT_TIMEOUT = get_timeout("http_default", 10)
 # Re-export for backwards compatibility
 HTTPError = HTTPRequestError
 
+# Shared session; requests.get/post would build (and tear down) a new one per call
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+atexit.register(_SESSION.close)
 
-def _handle_request_error(e: Exception, url: str) -> None:
+# http_json_get cache: (url, headers) -> (fetched_at, raw body, ETag). Bodies
+# are re-parsed on each hit so callers never share a mutable dict; expired
+# entries with an ETag are revalidated with If-None-Match instead of refetched.
+JSON_GET_CACHE_TTL_SECONDS = 30.0
+JSON_GET_CACHE_MAX_ENTRIES = 256
+_GET_CACHE: "OrderedDict[tuple, tuple[float, bytes, str | None]]" = OrderedDict()
+_get_cache_lock = threading.Lock()
+
+
+def set_default_headers(headers: dict[str, str]) -> None:
+    """
+    Set headers sent with every request, so callers don't repeat them.
+
+    Per-call headers are merged over these by requests.
+
+    Args:
+        headers: Headers to add to (or replace in) the session defaults
+    """
+    _SESSION.headers.update(headers)
+    # Cached responses were fetched with the old defaults
+    invalidate_cache()
+
+
+def invalidate_cache(url: str | None = None) -> None:
     """
-    Convert requests exceptions to Cortex HTTP exceptions.
+    Drop cached http_json_get responses.
+
+    Args:
+        url: Only drop entries for this URL (all entries if None)
+    """
+    with _get_cache_lock:
+        if url is None:
+            _GET_CACHE.clear()
+            return
+        for key in [k for k in _GET_CACHE if k[0] == url]:
+            del _GET_CACHE[key]
+
+
+# Errors translated by the helpers; anything else propagates unchanged
+_REQUEST_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.HTTPError,
+)
+
+
+def _to_cortex_error(e: Exception, url: str) -> ClientError:
+    """
+    Convert a requests exception (one of _REQUEST_ERRORS) to a Cortex HTTP exception.
+
+    isinstance checks (rather than a type-keyed lookup) keep subclasses such
+    as ConnectTimeout and SSLError mapped; order matters since ConnectTimeout
+    is both a ConnectionError and a Timeout.
 
     Args:
         e: The requests exception
         url: The request URL (for error messages)
 
-    Raises:
-        HTTPConnectionError: Connection failed
-        HTTPTimeoutError: Request timed out
-        HTTPRequestError: Bad status code
+    Returns:
+        HTTPConnectionError, HTTPTimeoutError, or HTTPRequestError to raise
     """
     if isinstance(e, requests.exceptions.ConnectionError):
-        raise HTTPConnectionError(f"Connection failed: {url}") from e
-    elif isinstance(e, requests.exceptions.Timeout):
-        raise HTTPTimeoutError(f"Request timed out: {url}") from e
-    elif isinstance(e, requests.exceptions.HTTPError):
-        raise HTTPRequestError(
-            f"HTTP {e.response.status_code}: {url}",
-            status_code=e.response.status_code,
-            response_text=e.response.text[:500] if e.response.text else None,
-        ) from e
-    else:
-        raise
+        return HTTPConnectionError(f"Connection failed: {url}")
+    if isinstance(e, requests.exceptions.Timeout):
+        return HTTPTimeoutError(f"Request timed out: {url}")
+    return HTTPRequestError(
+        f"HTTP {e.response.status_code}: {url}",
+        status_code=e.response.status_code,
+        response_text=e.response.text[:500] if e.response.text else None,
+    )
 
 
 def http_get(
@@ -84,17 +143,12 @@ def http_get(
         HTTPRequestError: Bad status code (if raise_for_status=True)
     """
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = _SESSION.get(url, headers=headers, timeout=timeout)
         if raise_for_status:
             response.raise_for_status()
         return response
-    except (
-        requests.exceptions.ConnectionError,
-        requests.exceptions.Timeout,
-        requests.exceptions.HTTPError,
-    ) as e:
-        _handle_request_error(e, url)
-        raise  # Unreachable, but satisfies type checker
+    except _REQUEST_ERRORS as e:
+        raise _to_cortex_error(e, url) from e
 
 
 def http_post(
@@ -125,31 +179,34 @@ def http_post(
         HTTPRequestError: Bad status code (if raise_for_status=True)
     """
     try:
-        response = requests.post(url, json=json, data=data, headers=headers, timeout=timeout)
+        response = _SESSION.post(url, json=json, data=data, headers=headers, timeout=timeout)
         if raise_for_status:
             response.raise_for_status()
         return response
-    except (
-        requests.exceptions.ConnectionError,
-        requests.exceptions.Timeout,
-        requests.exceptions.HTTPError,
-    ) as e:
-        _handle_request_error(e, url)
-        raise  # Unreachable, but satisfies type checker
+    except _REQUEST_ERRORS as e:
+        raise _to_cortex_error(e, url) from e
 
 
 def http_json_get(
     url: str,
     headers: dict[str, str] | None = None,
     timeout: float = DEFAULT_TIMEOUT,
+    cache: bool = False,
 ) -> dict[str, Any]:
     """
     GET request that returns parsed JSON.
 
+    With cache=True, identical requests within JSON_GET_CACHE_TTL_SECONDS
+    are served from cache, unless the response said Cache-Control:
+    no-cache/no-store. After that, a response that carried an ETag is
+    revalidated with If-None-Match and a 304 reuses the cached body.
+    Leave caching off for liveness checks, which must hit the server.
+
     Args:
         url: Request URL
         headers: Optional headers dict
         timeout: Request timeout in seconds
+        cache: Serve repeat requests from (and store the response in) the cache
 
     Returns:
         Parsed JSON as dict
@@ -159,12 +216,40 @@ def http_json_get(
         HTTPTimeoutError: Request timed out
         HTTPRequestError: Bad status code or invalid JSON
     """
-    response = http_get(url, headers=headers, timeout=timeout)
+    key = (url, tuple(sorted(headers.items())) if headers else ())
+    entry = None
+    request_headers = headers
+    if cache:
+        with _get_cache_lock:
+            entry = _GET_CACHE.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= JSON_GET_CACHE_TTL_SECONDS:
+                _GET_CACHE.move_to_end(key)
+                return jsonlib.loads(entry[1])
+        if entry is not None and entry[2]:
+            request_headers = {**(headers or {}), "If-None-Match": entry[2]}
+
+    response = http_get(url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and entry is not None:
+        # Unchanged on the server: keep the cached body for another TTL
+        with _get_cache_lock:
+            _GET_CACHE[key] = (time.monotonic(), entry[1], entry[2])
+            _GET_CACHE.move_to_end(key)
+        return jsonlib.loads(entry[1])
+
     try:
-        return response.json()
+        data = response.json()
     except ValueError as e:
         raise HTTPRequestError(f"Invalid JSON response from {url}") from e
 
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if cache and "no-cache" not in cache_control and "no-store" not in cache_control:
+        with _get_cache_lock:
+            _GET_CACHE[key] = (time.monotonic(), response.content, response.headers.get("ETag"))
+            _GET_CACHE.move_to_end(key)
+            while len(_GET_CACHE) > JSON_GET_CACHE_MAX_ENTRIES:
+                _GET_CACHE.popitem(last=False)
+    return data
+
 
 def http_json_post(
     url: str,
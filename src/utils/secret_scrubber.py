@@ -41,6 +41,25 @@ SECRET_PATTERNS: list[tuple[str, str]] = [
     ),
 ]
 
+# All patterns as one alternation, so each text is scanned once. Group
+# p<i> maps back to SECRET_PATTERNS[i]. When matches overlap, the leftmost
+# one is redacted whole (earlier patterns win at the same position), so a
+# secret nested inside another gets the outer match's marker. The inline
+# (?i) flags are dropped since the whole regex is case-insensitive
+# (matching the previous per-pattern compile).
+_SECRET_RE = re.compile(
+    "|".join(
+        f"(?P<p{i}>{pattern.removeprefix('(?i)')})"
+        for i, (pattern, _) in enumerate(SECRET_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+_REPLACEMENTS = {f"p{i}": replacement for i, (_, replacement) in enumerate(SECRET_PATTERNS)}
+
+
+def _redact(match: re.Match) -> str:
+    return _REPLACEMENTS[match.lastgroup]
+
 
 def scrub_secrets(text: str) -> str:
     """
@@ -54,6 +73,4 @@ def scrub_secrets(text: str) -> str:
     Returns:
         Text with secrets replaced by redaction markers
     """
-    for pattern, replacement in SECRET_PATTERNS:
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    return text
+    return _SECRET_RE.sub(_redact, text)
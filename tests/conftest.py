@@ -18,6 +18,67 @@ sys.path.insert(0, str(project_root))
 os.environ["CORTEX_DB_PATH"] = "/tmp/cortex_test_db"
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "real_embeddings: use Chroma's ONNX embedding model instead of hash embeddings",
+    )
+
+
+class HashEmbeddingFunction:
+    """
+    Deterministic stand-in for Chroma's default ONNX embedding model.
+
+    Each text maps to a fixed pseudo-random vector seeded from its hash, so
+    ID/metadata/document round-trips and keyword search behave as usual
+    without loading (or downloading) the model. Vectors carry no meaning.
+    """
+
+    dimensions = 384
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, input):
+        import hashlib
+
+        import numpy as np
+
+        return [
+            np.random.default_rng(
+                int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+            ).standard_normal(self.dimensions).astype(np.float32)
+            for text in input
+        ]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def hash_embeddings():
+    """Embed with HashEmbeddingFunction unless a test is marked real_embeddings."""
+    from unittest.mock import patch
+
+    from chromadb.utils.embedding_functions import onnx_mini_lm_l6_v2
+
+    original = onnx_mini_lm_l6_v2.ONNXMiniLM_L6_V2
+    with patch.object(onnx_mini_lm_l6_v2, "ONNXMiniLM_L6_V2", HashEmbeddingFunction):
+        yield original
+
+
+@pytest.fixture(autouse=True)
+def real_embeddings(request, hash_embeddings):
+    """Restore the ONNX model for tests that check semantic matching."""
+    if request.node.get_closest_marker("real_embeddings") is None:
+        yield
+        return
+
+    from unittest.mock import patch
+
+    from chromadb.utils.embedding_functions import onnx_mini_lm_l6_v2
+
+    with patch.object(onnx_mini_lm_l6_v2, "ONNXMiniLM_L6_V2", hash_embeddings):
+        yield
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for test files."""
@@ -25,33 +86,44 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def temp_git_repo(temp_dir: Path) -> Path:
-    """Create a temporary git repository."""
+@pytest.fixture(scope="session")
+def git_seed_repo(tmp_path_factory) -> Path:
+    """Build the initial-commit repository once per session (see temp_git_repo)."""
     import subprocess
 
-    subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
+    seed = tmp_path_factory.mktemp("git_seed")
+    subprocess.run(["git", "init"], cwd=seed, capture_output=True)
     subprocess.run(
         ["git", "config", "user.email", "test@test.com"],
-        cwd=temp_dir,
+        cwd=seed,
         capture_output=True,
     )
     subprocess.run(
         ["git", "config", "user.name", "Test User"],
-        cwd=temp_dir,
+        cwd=seed,
         capture_output=True,
     )
 
     # Create an initial commit
-    test_file = temp_dir / "README.md"
+    test_file = seed / "README.md"
     test_file.write_text("# Test Repo")
-    subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
+    subprocess.run(["git", "add", "."], cwd=seed, capture_output=True)
     subprocess.run(
         ["git", "commit", "-m", "Initial commit"],
-        cwd=temp_dir,
+        cwd=seed,
         capture_output=True,
     )
 
+    return seed
+
+
+@pytest.fixture
+def temp_git_repo(temp_dir: Path, git_seed_repo: Path) -> Path:
+    """Create a temporary git repository with one commit (a copy of the session seed)."""
+    import shutil
+
+    # Copying the seed is much cheaper than the five git processes it took to build
+    shutil.copytree(git_seed_repo, temp_dir, dirs_exist_ok=True)
     return temp_dir
 
 
@@ -145,15 +217,60 @@ API_URL = "https://api.example.com"
     return file_path
 
 
-@pytest.fixture
-def temp_chroma_client():
-    """Create a temporary ChromaDB client for testing."""
+@pytest.fixture(scope="session")
+def shared_chroma_client():
+    """Create the in-memory ChromaDB client once per test session."""
     import chromadb
     from chromadb.config import Settings
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        client = chromadb.PersistentClient(
-            path=tmpdir,
-            settings=Settings(anonymized_telemetry=False),
-        )
-        yield client
+    return chromadb.EphemeralClient(
+        settings=Settings(anonymized_telemetry=False, allow_reset=True),
+    )
+
+
+@pytest.fixture
+def temp_chroma_client(shared_chroma_client):
+    """
+    Provide an in-memory ChromaDB client for testing.
+
+    The client is shared across the session; the collections a test
+    creates are dropped afterwards to keep tests isolated, which is
+    cheaper than a full client reset.
+    """
+    yield shared_chroma_client
+    for collection in shared_chroma_client.list_collections():
+        shared_chroma_client.delete_collection(collection.name)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_reranker_model():
+    """
+    Load each FlashRank model at most once per test session.
+
+    Many tests call reset_services(), which drops the reranker singleton, so
+    the next search would otherwise reload the model. This covers the
+    services path; tests that rerank directly take the reranker fixture.
+    """
+    from unittest.mock import patch
+
+    from src.tools.search import reranker as reranker_module
+
+    original = reranker_module.RerankerService
+    instances: dict = {}
+
+    def shared_service(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in instances:
+            instances[key] = original(*args, **kwargs)
+        return instances[key]
+
+    with patch.object(reranker_module, "RerankerService", shared_service):
+        yield
+
+
+@pytest.fixture(scope="session")
+def reranker(shared_reranker_model):
+    """Default RerankerService, shared with the services singleton."""
+    from src.tools.search import reranker as reranker_module
+
+    return reranker_module.RerankerService()
@@ -7,47 +7,74 @@ These endpoints are used by the CLI commands:
 """
 
 import json
-import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from src.configs.services import reset_services, set_collection
+from src.controllers.http import app
+from src.controllers.http.api import ProcessSyncRequest, process_sync
+from src.controllers.http.api.core import NoteRequest, save_note, search
+from src.storage import get_or_create_collection
 
-@pytest.fixture
-def api_client(temp_chroma_client):
-    """Create a test client for the HTTP API."""
-    from src.configs.services import reset_services
 
+@pytest.fixture(scope="module")
+def app_services(shared_chroma_client):
+    """Point the service singletons at the session client for the whole module."""
     # Reset the ResourceManager singleton before patching
     reset_services()
 
     # Patch the ChromaDB client in the resources module
-    with patch("src.configs.services.get_chroma_client", return_value=temp_chroma_client):
-        from src.controllers.http import app
-        client = TestClient(app)
-        yield client
+    with patch("src.configs.services.get_chroma_client", return_value=shared_chroma_client):
+        yield
 
-    # Reset after test
+    # Reset after the module
     reset_services()
 
 
-@pytest.fixture
-def browse_client(temp_chroma_client):
-    """Create a test client for the browse API with patched ChromaDB."""
-    from src.configs.services import reset_services
+class _OrderPreservingReranker:
+    """Stand-in reranker that keeps retrieval order and assigns descending scores."""
 
-    # Reset the ResourceManager singleton before patching
-    reset_services()
+    def rerank(self, query, documents, top_k=5):
+        return [
+            {**doc, "rerank_score": 1.0 - 0.01 * i}
+            for i, doc in enumerate(documents[:top_k])
+        ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fake_reranker(app_services):
+    """
+    Skip the cross-encoder in endpoint tests.
 
-    with patch("src.configs.services.get_chroma_client", return_value=temp_chroma_client):
-        from src.controllers.http import app
-        client = TestClient(app)
+    These tests cover request handling, filtering and response shape;
+    rerank quality is covered by the search pipeline tests.
+    """
+    with patch("src.controllers.http.api.core.get_reranker", return_value=_OrderPreservingReranker()):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def fresh_collection(app_services, temp_chroma_client):
+    """Give each test an empty collection (temp_chroma_client drops it afterwards)."""
+    set_collection(get_or_create_collection(temp_chroma_client, "cortex_memory"))
+
+
+@pytest.fixture(scope="module")
+def api_client(app_services):
+    """Create one test client for the HTTP API, shared by the module."""
+    with TestClient(app) as client:
         yield client
 
-    # Reset after test
-    reset_services()
+
+@pytest.fixture(scope="module")
+def browse_client(api_client):
+    """Browse endpoints live on the same app, so reuse the shared client."""
+    return api_client
 
 
 class TestSearchEndpoint:
@@ -55,8 +82,6 @@ class TestSearchEndpoint:
 
     def test_search_returns_results(self, api_client, temp_chroma_client):
         """Test that search returns results from indexed content."""
-        from src.storage import get_or_create_collection
-
         # Seed test data
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
@@ -84,16 +109,14 @@ class TestSearchEndpoint:
 
     def test_search_with_limit(self, api_client, temp_chroma_client):
         """Test search respects limit parameter."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
-        # Add multiple documents
-        for i in range(10):
-            collection.add(
-                documents=[f"Document about authentication method {i}"],
-                ids=[f"auth-doc-{i}"],
-                metadatas=[{"repository": "test", "branch": "main", "type": "note", "title": "", "tags": ""}],
-            )
+        # Add multiple documents in one batch
+        collection.add(
+            documents=[f"Document about authentication method {i}" for i in range(10)],
+            ids=[f"auth-doc-{i}" for i in range(10)],
+            # Chroma copies metadata on write, so one dict can back every row
+            metadatas=[{"repository": "test", "branch": "main", "type": "note", "title": "", "tags": ""}] * 10,
+        )
 
         response = api_client.get("/search", params={"q": "authentication", "limit": 3})
 
@@ -103,8 +126,6 @@ class TestSearchEndpoint:
 
     def test_search_with_project_filter(self, api_client, temp_chroma_client):
         """Test search filters by project."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=[
@@ -128,8 +149,6 @@ class TestSearchEndpoint:
 
     def test_search_with_min_score(self, api_client, temp_chroma_client):
         """Test search filters by minimum score."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Exact match for authentication"],
@@ -164,66 +183,67 @@ class TestSearchEndpoint:
         data = response.json()
         assert data["results"] == []
 
+    def test_repeated_search_served_from_cache(self, api_client):
+        """Test that an identical search between writes skips retrieval and reranking."""
+        searcher = MagicMock()
+        searcher.search.return_value = [{"text": "cached doc", "meta": {}, "rerank_score": 0.9}]
+        reranker = MagicMock()
+        reranker.rerank.side_effect = lambda q, results, top_k: results
+
+        with patch("src.controllers.http.api.core.get_searcher", return_value=searcher), \
+             patch("src.controllers.http.api.core.get_reranker", return_value=reranker):
+            first = api_client.get("/search", params={"q": "cache me"}).json()
+            second = api_client.get("/search", params={"q": "cache me"}).json()
+
+        assert searcher.search.call_count == 1
+        assert second["results"] == first["results"]
+
 
 class TestNoteEndpoint:
     """Tests for POST /note endpoint."""
 
-    def test_save_note_basic(self, api_client):
-        """Test basic note creation."""
-        response = api_client.post(
-            "/note",
-            json={"content": "This is a test note about architecture decisions."}
-        )
+    @pytest.mark.parametrize("payload, expected", [
+        ({"content": "This is a test note about architecture decisions."}, {}),
+        (
+            {"content": "We decided to use PostgreSQL for better query performance.", "title": "Database Decision"},
+            {"title": "Database Decision"},
+        ),
+        ({"content": "Use Redis for caching API responses.", "tags": ["caching", "performance", "infrastructure"]}, {}),
+        ({"content": "Project-specific documentation.", "repository": "my-custom-project"}, {}),
+    ], ids=["basic", "with_title", "with_tags", "with_project"])
+    def test_save_note(self, api_client, payload, expected):
+        """Test note creation with optional title, tags and project."""
+        response = api_client.post("/note", json=payload)
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
-        assert "id" in data
         assert data["id"].startswith("note_")
         assert data["content_length"] > 0
+        for key, value in expected.items():
+            assert data[key] == value
 
-    def test_save_note_with_title(self, api_client):
-        """Test note creation with title."""
-        response = api_client.post(
-            "/note",
-            json={
-                "content": "We decided to use PostgreSQL for better query performance.",
-                "title": "Database Decision"
-            }
-        )
+    def test_save_same_note_twice_is_idempotent(self, api_client):
+        """Test that a repeated note gets the same ID and is not embedded again."""
+        collection = MagicMock()
+        collection.get.return_value = {"ids": []}
+        payload = {"content": "Use Redis for caching.", "repository": "infra"}
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert data["title"] == "Database Decision"
+        with patch("src.controllers.http.api.core.get_collection", return_value=collection):
+            first = api_client.post("/note", json=payload).json()
+            collection.get.return_value = {"ids": [first["id"]]}
+            second = api_client.post("/note", json=payload).json()
 
-    def test_save_note_with_tags(self, api_client):
-        """Test note creation with tags."""
-        response = api_client.post(
-            "/note",
-            json={
-                "content": "Use Redis for caching API responses.",
-                "tags": ["caching", "performance", "infrastructure"]
-            }
-        )
+        assert second["id"] == first["id"]
+        assert second["duplicate"] is True
+        assert collection.add.call_count == 1
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
+    def test_note_request_is_hashable(self):
+        """Test that frozen note requests with tags can be hashed and compared."""
+        request = NoteRequest(content="a", tags=["x", "y"])
 
-    def test_save_note_with_project(self, api_client):
-        """Test note creation with custom project."""
-        response = api_client.post(
-            "/note",
-            json={
-                "content": "Project-specific documentation.",
-                "repository": "my-custom-project"
-            }
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
+        assert request.tags == ("x", "y")
+        assert hash(request) == hash(NoteRequest(content="a", tags=("x", "y")))
 
     def test_save_note_empty_content_fails(self, api_client):
         """Test that empty content returns 422."""
@@ -244,26 +264,18 @@ class TestNoteEndpoint:
         )
         assert response.status_code == 422
 
-    def test_saved_note_is_searchable(self, api_client, temp_chroma_client):
+    def test_saved_note_is_searchable(self, app_services):
         """Test that saved notes can be found via search."""
-        # Save a note
-        save_response = api_client.post(
-            "/note",
-            json={
-                "content": "Unique architecture decision about microservices",
-                "title": "Microservices ADR"
-            }
-        )
-        assert save_response.status_code == 200
+        # Call the handlers directly; HTTP validation is covered above
+        saved = save_note(NoteRequest(
+            content="Unique architecture decision about microservices",
+            title="Microservices ADR",
+        ))
+        assert saved["status"] == "success"
 
-        # Search for it
-        search_response = api_client.get("/search", params={"q": "microservices architecture"})
-        assert search_response.status_code == 200
+        response = search(q="microservices architecture", limit=5, repository=None, min_score=0.3)
 
-        data = search_response.json()
-        # Should find the note
-        found = any("microservices" in r["content"].lower() for r in data["results"])
-        assert found, "Saved note should be searchable"
+        assert saved["id"] in {r["id"] for r in response.results}, "Saved note should be searchable"
 
 
 class TestInfoEndpoint:
@@ -279,6 +291,15 @@ class TestInfoEndpoint:
         assert "git_commit" in data
         assert "build_time" in data
 
+    def test_info_revalidation_returns_not_modified(self, api_client):
+        """Test that a request carrying the current ETag gets 304 with no body."""
+        etag = api_client.get("/info").headers["ETag"]
+
+        response = api_client.get("/info", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
 
 class TestIngestEndpoint:
     """Tests for POST /ingest endpoint (web clipper)."""
@@ -318,21 +339,20 @@ class TestIngestEndpoint:
     def test_ingested_content_searchable(self, api_client):
         """Test that ingested web content is searchable."""
         # Ingest content
-        api_client.post(
+        ingested = api_client.post(
             "/ingest",
             json={
                 "url": "https://unique-test-url.com/page",
                 "content": "Unique searchable content about quantum computing",
             }
-        )
+        ).json()
 
         # Search for it
         search_response = api_client.get("/search", params={"q": "quantum computing"})
         assert search_response.status_code == 200
 
         data = search_response.json()
-        found = any("quantum" in r["content"].lower() for r in data["results"])
-        assert found, "Ingested content should be searchable"
+        assert ingested["id"] in {r["id"] for r in data["results"]}, "Ingested content should be searchable"
 
 
 class TestFocusedInitiativeEndpoint:
@@ -472,8 +492,6 @@ class TestProcessSyncWithInitiative:
         self, mock_load_config, mock_get_provider, mock_conclude
     ):
         """Test that initiative_id is passed through to conclude_session."""
-        from src.controllers.http.api import ProcessSyncRequest, process_sync
-
         mock_load_config.return_value = {}
         mock_provider = MagicMock()
         mock_provider.summarize_session.return_value = "Generated summary"
@@ -502,8 +520,6 @@ class TestProcessSyncWithInitiative:
         self, mock_load_config, mock_get_provider, mock_conclude
     ):
         """Test process_sync works without initiative_id (passes None)."""
-        from src.controllers.http.api import ProcessSyncRequest, process_sync
-
         mock_load_config.return_value = {}
         mock_provider = MagicMock()
         mock_provider.summarize_session.return_value = "Generated summary"
@@ -531,8 +547,6 @@ class TestBrowseUpdateEndpoint:
 
     def test_update_note_title(self, browse_client, temp_chroma_client):
         """Test updating a note's title."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Original note content"],
@@ -563,8 +577,6 @@ class TestBrowseUpdateEndpoint:
 
     def test_update_note_content(self, browse_client, temp_chroma_client):
         """Test updating a note's content."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Original content"],
@@ -594,8 +606,6 @@ class TestBrowseUpdateEndpoint:
 
     def test_update_note_tags(self, browse_client, temp_chroma_client):
         """Test updating a note's tags."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Note with tags"],
@@ -625,8 +635,6 @@ class TestBrowseUpdateEndpoint:
 
     def test_update_insight_with_files(self, browse_client, temp_chroma_client):
         """Test updating an insight's files list."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Insight about code pattern"],
@@ -663,8 +671,6 @@ class TestBrowseUpdateEndpoint:
 
     def test_update_non_editable_type(self, browse_client, temp_chroma_client):
         """Test that code documents cannot be edited."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["def hello(): pass"],
@@ -689,8 +695,6 @@ class TestBrowseUpdateEndpoint:
 
     def test_update_session_summary_content(self, browse_client, temp_chroma_client):
         """Test updating a session summary's content."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Original session summary"],
@@ -714,8 +718,6 @@ class TestBrowseUpdateEndpoint:
 
     def test_update_session_summary_title_not_allowed(self, browse_client, temp_chroma_client):
         """Test that session summaries cannot have their title updated (not an editable field)."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Session summary"],
@@ -744,8 +746,6 @@ class TestBrowseDeleteEndpoint:
 
     def test_delete_note(self, browse_client, temp_chroma_client):
         """Test deleting a note."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Note to delete"],
@@ -772,8 +772,6 @@ class TestBrowseDeleteEndpoint:
 
     def test_delete_insight(self, browse_client, temp_chroma_client):
         """Test deleting an insight."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Insight to delete"],
@@ -794,8 +792,6 @@ class TestBrowseDeleteEndpoint:
 
     def test_delete_code_chunk(self, browse_client, temp_chroma_client):
         """Test deleting a code chunk (all types are deletable)."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["def hello(): pass"],
@@ -822,8 +818,6 @@ class TestBrowseDeleteEndpoint:
 
     def test_delete_session_summary(self, browse_client, temp_chroma_client):
         """Test deleting a session summary."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Session summary to delete"],
@@ -851,8 +845,6 @@ class TestBrowseCleanupEndpoint:
 
     def test_cleanup_dry_run(self, browse_client, temp_chroma_client, temp_dir):
         """Test cleanup in dry_run mode shows orphaned documents."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
 
         # Add file_metadata for non-existent file
@@ -884,8 +876,6 @@ class TestBrowseCleanupEndpoint:
 
     def test_cleanup_execute(self, browse_client, temp_chroma_client, temp_dir):
         """Test cleanup actually deletes orphaned documents."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
 
         # Add file_metadata for non-existent file
@@ -933,8 +923,6 @@ class TestBrowseCleanupEndpoint:
 
     def test_cleanup_returns_breakdown(self, browse_client, temp_chroma_client, temp_dir):
         """Test that cleanup returns breakdown by document type."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
 
         # Add various orphaned document types
@@ -969,8 +957,6 @@ class TestBrowsePurgeEndpoint:
 
     def test_purge_by_repository_dry_run(self, browse_client, temp_chroma_client):
         """Test purge by repository in dry_run mode."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Doc from target repo", "Doc from other repo"],
@@ -998,8 +984,6 @@ class TestBrowsePurgeEndpoint:
 
     def test_purge_by_type(self, browse_client, temp_chroma_client):
         """Test purge by document type."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Note 1", "Note 2", "Insight 1"],
@@ -1025,8 +1009,6 @@ class TestBrowsePurgeEndpoint:
 
     def test_purge_execute(self, browse_client, temp_chroma_client):
         """Test purge actually deletes documents."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["To purge"],
@@ -1064,9 +1046,6 @@ class TestBrowsePurgeEndpoint:
 
     def test_purge_with_date_filters(self, browse_client, temp_chroma_client):
         """Test purge with date range filters."""
-        from datetime import datetime, timedelta, timezone
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
 
         old_date = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
@@ -1097,8 +1076,6 @@ class TestBrowsePurgeEndpoint:
 
     def test_purge_returns_sample_ids(self, browse_client, temp_chroma_client):
         """Test that purge returns sample IDs of matched documents."""
-        from src.storage import get_or_create_collection
-
         collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
         collection.add(
             documents=["Doc 1", "Doc 2", "Doc 3"],
@@ -1198,9 +1175,6 @@ class TestIngestStatusEndpoints:
 
     def test_list_ingest_tasks(self, api_client):
         """Test listing ingestion tasks."""
-        from unittest.mock import MagicMock
-        from dataclasses import dataclass
-
         @dataclass
         class MockTask:
             task_id: str
@@ -1238,8 +1212,6 @@ class TestIngestStatusEndpoints:
 
     def test_list_ingest_tasks_with_repository_filter(self, api_client):
         """Test listing ingestion tasks filtered by repository."""
-        from unittest.mock import MagicMock
-
         mock_worker = MagicMock()
         mock_worker._store.get_all_tasks.return_value = []
 
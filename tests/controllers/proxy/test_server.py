@@ -16,8 +16,7 @@ class TestProxyServer:
         from src.external.llm import ClaudeCLIProvider
 
         # Reset the cached provider
-        import src.controllers.proxy.server as proxy_module
-        proxy_module._provider = None
+        get_provider.cache_clear()
 
         provider = get_provider()
         assert isinstance(provider, ClaudeCLIProvider)
@@ -27,8 +26,7 @@ class TestProxyServer:
         from src.controllers.proxy.server import get_provider
 
         # Reset the cached provider
-        import src.controllers.proxy.server as proxy_module
-        proxy_module._provider = None
+        get_provider.cache_clear()
 
         provider1 = get_provider()
         provider2 = get_provider()
@@ -2,20 +2,24 @@
 Tests for git delta sync functions (src/external/git/).
 """
 
+import os
+import subprocess
 from pathlib import Path
 
-import pytest
-
 from src.external.git import get_git_changed_files, get_head_commit, get_untracked_files, is_git_repo
 
 
+def _commit_all(repo: Path, message: str) -> None:
+    """Stage everything in the working tree and commit it."""
+    subprocess.run(["git", "add", "-A"], cwd=repo, capture_output=True)
+    subprocess.run(["git", "commit", "-m", message], cwd=repo, capture_output=True)
+
+
 class TestGitIntegration:
     """Tests for git-based delta sync."""
 
     def test_is_git_repo_true(self, temp_dir: Path):
         """Test git repo detection in actual git repo."""
-        import subprocess
-
         # Initialize a git repo
         subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
 
@@ -25,165 +29,69 @@ class TestGitIntegration:
         """Test git repo detection in non-git directory."""
         assert is_git_repo(str(temp_dir)) is False
 
-    def test_get_head_commit(self, temp_dir: Path):
+    def test_get_head_commit(self, temp_git_repo: Path):
         """Test getting HEAD commit hash."""
-        import subprocess
-
-        # Initialize git repo with a commit
-        subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        (temp_dir / "test.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
-        commit = get_head_commit(str(temp_dir))
+        commit = get_head_commit(str(temp_git_repo))
 
         assert commit is not None
         assert len(commit) == 40  # SHA-1 hash length
 
     def test_get_head_commit_no_commits(self, temp_dir: Path):
         """Test HEAD commit in repo with no commits."""
-        import subprocess
-
         subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
 
         commit = get_head_commit(str(temp_dir))
 
         assert commit is None
 
-    def test_get_git_changed_files(self, temp_dir: Path):
+    def test_get_git_changed_files(self, temp_git_repo: Path):
         """Test git-based change detection."""
-        import subprocess
+        (temp_git_repo / "file1.py").write_text("original")
+        _commit_all(temp_git_repo, "initial")
 
-        # Initialize git repo with initial commit
-        subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        (temp_dir / "file1.py").write_text("original")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
-        initial_commit = get_head_commit(str(temp_dir))
-
-        # Make changes: modify file1, add file2, delete file3
-        (temp_dir / "file1.py").write_text("modified")
-        (temp_dir / "file2.py").write_text("new file")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "changes"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
-        modified, deleted, renamed = get_git_changed_files(str(temp_dir), initial_commit)
+        initial_commit = get_head_commit(str(temp_git_repo))
+
+        # Make changes: modify file1, add file2
+        (temp_git_repo / "file1.py").write_text("modified")
+        (temp_git_repo / "file2.py").write_text("new file")
+        _commit_all(temp_git_repo, "changes")
+
+        modified, deleted, renamed = get_git_changed_files(str(temp_git_repo), initial_commit)
 
         assert any("file1.py" in f for f in modified)
         assert any("file2.py" in f for f in modified)
         assert deleted == []
         assert renamed == []
 
-    def test_get_git_changed_files_with_delete(self, temp_dir: Path):
+    def test_get_git_changed_files_with_delete(self, temp_git_repo: Path):
         """Test git detects deleted files."""
-        import subprocess
+        (temp_git_repo / "to_delete.py").write_text("will be deleted")
+        (temp_git_repo / "keep.py").write_text("keep this")
+        _commit_all(temp_git_repo, "initial")
 
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        (temp_dir / "to_delete.py").write_text("will be deleted")
-        (temp_dir / "keep.py").write_text("keep this")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
-        initial_commit = get_head_commit(str(temp_dir))
+        initial_commit = get_head_commit(str(temp_git_repo))
 
         # Delete file
-        (temp_dir / "to_delete.py").unlink()
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "delete file"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
+        (temp_git_repo / "to_delete.py").unlink()
+        _commit_all(temp_git_repo, "delete file")
 
-        modified, deleted, renamed = get_git_changed_files(str(temp_dir), initial_commit)
+        modified, deleted, renamed = get_git_changed_files(str(temp_git_repo), initial_commit)
 
         assert any("to_delete.py" in f for f in deleted)
         assert not any("keep.py" in f for f in deleted)
 
-    def test_get_git_changed_files_with_rename(self, temp_dir: Path):
+    def test_get_git_changed_files_with_rename(self, temp_git_repo: Path):
         """Test git detects renamed files."""
-        import subprocess
+        (temp_git_repo / "old_name.py").write_text("content")
+        _commit_all(temp_git_repo, "initial")
 
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        (temp_dir / "old_name.py").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
-        initial_commit = get_head_commit(str(temp_dir))
+        initial_commit = get_head_commit(str(temp_git_repo))
 
         # Rename file
-        (temp_dir / "old_name.py").rename(temp_dir / "new_name.py")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "rename file"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
+        (temp_git_repo / "old_name.py").rename(temp_git_repo / "new_name.py")
+        _commit_all(temp_git_repo, "rename file")
 
-        modified, deleted, renamed = get_git_changed_files(str(temp_dir), initial_commit)
+        modified, deleted, renamed = get_git_changed_files(str(temp_git_repo), initial_commit)
 
         # Renamed files should appear in renamed list
         assert len(renamed) == 1
@@ -193,36 +101,16 @@ class TestGitIntegration:
         # New path should also be in modified for indexing
         assert any("new_name.py" in f for f in modified)
 
-    def test_get_untracked_files(self, temp_dir: Path):
+    def test_get_untracked_files(self, temp_git_repo: Path):
         """Test detection of untracked files."""
-        import os
-        import subprocess
-
-        subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
         # Create initial tracked file
-        (temp_dir / "committed_file.py").write_text("tracked")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
+        (temp_git_repo / "committed_file.py").write_text("tracked")
+        _commit_all(temp_git_repo, "initial")
 
         # Add untracked file
-        (temp_dir / "new_untracked.py").write_text("untracked")
+        (temp_git_repo / "new_untracked.py").write_text("untracked")
 
-        untracked = get_untracked_files(str(temp_dir))
+        untracked = get_untracked_files(str(temp_git_repo))
 
         # Check by filename to avoid path substring issues
         untracked_names = [os.path.basename(f) for f in untracked]
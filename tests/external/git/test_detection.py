@@ -5,8 +5,6 @@ Tests for git detection functions (src/external/git/detection.py).
 import subprocess
 from pathlib import Path
 
-import pytest
-
 
 class TestGitStalenessDetection:
     """Tests for git staleness detection functions."""
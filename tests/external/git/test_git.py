@@ -2,10 +2,9 @@
 Tests for git utility functions (src/external/git/).
 """
 
+import subprocess
 from pathlib import Path
 
-import pytest
-
 from src.external.git import get_current_branch, get_git_info
 
 
@@ -37,3 +36,69 @@ class TestGitDetection:
         """Test get_current_branch in a non-git directory."""
         branch = get_current_branch(str(temp_dir))
         assert branch == "unknown"
+
+
+class TestHeadCommit:
+    """Tests for HEAD commit resolution."""
+
+    def test_head_commit_matches_git(self, temp_git_repo: Path):
+        """Test that reading HEAD from .git matches git rev-parse."""
+        from src.external.git import get_head_commit
+        from src.external.git.detection import _read_head_commit
+
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        assert _read_head_commit(str(temp_git_repo)) == expected
+        assert get_head_commit(str(temp_git_repo)) == expected
+
+    def test_head_commit_packed_refs(self, temp_git_repo: Path):
+        """Test that HEAD resolves through packed-refs after git gc."""
+        from src.external.git.detection import _read_head_commit
+
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        subprocess.run(["git", "pack-refs", "--all"], cwd=temp_git_repo, capture_output=True)
+
+        assert _read_head_commit(str(temp_git_repo)) == expected
+
+    def test_branch_read_from_head_matches_git(self, temp_git_repo: Path):
+        """Test that the branch read from .git/HEAD matches git, including after checkout."""
+        from src.external.git.detection import _read_head_branch
+
+        expected = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert _read_head_branch(str(temp_git_repo)) == expected
+
+        subprocess.run(["git", "checkout", "-b", "feature/x"], cwd=temp_git_repo, capture_output=True)
+        assert _read_head_branch(str(temp_git_repo)) == "feature/x"
+        assert get_current_branch(str(temp_git_repo)) == "feature/x"
+
+    def test_branch_detached_head_falls_back_to_git(self, temp_git_repo: Path):
+        """Test that a detached HEAD is left to git."""
+        from src.external.git.detection import _read_head_branch
+
+        subprocess.run(["git", "checkout", "--detach"], cwd=temp_git_repo, capture_output=True)
+
+        assert _read_head_branch(str(temp_git_repo)) is None
+        assert get_current_branch(str(temp_git_repo)) == "HEAD"
+
+    def test_head_commit_non_git(self, temp_dir: Path):
+        """Test that non-git directories resolve to None."""
+        from src.external.git import get_head_commit
+        from src.external.git.detection import _read_head_commit
+
+        assert _read_head_commit(str(temp_dir)) is None
+        assert get_head_commit(str(temp_dir)) is None
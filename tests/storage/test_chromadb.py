@@ -2,9 +2,11 @@
 Tests for ChromaDB storage (src/storage/chromadb.py).
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from src.storage import get_collection_stats, get_or_create_collection
+from src.storage import UpsertBatch, get_collection_stats, get_or_create_collection
 
 
 class TestChromaDB:
@@ -32,3 +34,26 @@ class TestChromaDB:
         )
         stats = get_collection_stats(collection)
         assert stats["document_count"] == 3
+
+
+class TestUpsertBatch:
+    """Tests for buffered upserts."""
+
+    def test_flush_writes_buffered_documents_in_one_call(self):
+        """Test that buffered upserts go out in one call and a repeated ID keeps the last write."""
+        collection = MagicMock()
+        batch = UpsertBatch(collection)
+
+        batch.upsert(ids=["a"], documents=["first"], metadatas=[{"n": 1}])
+        batch.upsert(ids=["b", "a"], documents=["other", "second"], metadatas=[{"n": 2}, {"n": 3}])
+        assert len(batch) == 2
+        collection.upsert.assert_not_called()
+
+        assert batch.flush() == 2
+        collection.upsert.assert_called_once_with(
+            ids=["a", "b"],
+            documents=["second", "other"],
+            metadatas=[{"n": 3}, {"n": 2}],
+        )
+        assert len(batch) == 0
+        assert batch.flush() == 0
@@ -14,7 +14,7 @@ import pytest
 class TestSearchCortex:
     """Tests for search_cortex tool."""
 
-    def test_search_returns_results(self, temp_dir: Path, temp_chroma_client):
+    def test_search_returns_results(self, temp_dir: Path, temp_chroma_client, reranker):
         """Test that search returns results from indexed content."""
         from src.storage import get_or_create_collection
 
@@ -35,10 +35,9 @@ class TestSearchCortex:
         )
 
         # Import and test search
-        from src.tools.search import HybridSearcher, RerankerService
+        from src.tools.search import HybridSearcher
 
         searcher = HybridSearcher(collection)
-        reranker = RerankerService()
 
         # Build index
         searcher.build_index()
@@ -112,6 +111,84 @@ class TestSearchCortex:
         assert len(parsed["results"]) > 0
         assert parsed["results"][0]["created_at"] == timestamp
 
+    def test_search_include_context_false_skips_context(self, temp_chroma_client):
+        """Test that include_context=False leaves out skeleton and tech stack context."""
+        from src.configs.services import reset_services, set_collection
+        from src.storage import get_or_create_collection
+        from src.tools.search.search import search_cortex
+
+        reset_services()
+        collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
+        set_collection(collection)
+
+        collection.add(
+            documents=["Decision to cache search responses", "Python, ChromaDB"],
+            ids=["note:ctx1", "TestRepo:tech_stack"],
+            metadatas=[
+                {"type": "note", "repository": "TestRepo", "branch": "unknown"},
+                {"type": "tech_stack", "repository": "TestRepo", "branch": "unknown"},
+            ],
+        )
+
+        with_context = json.loads(search_cortex(query="cache search responses", repository="TestRepo"))
+        without_context = json.loads(search_cortex(
+            query="cache search responses", repository="TestRepo", include_context=False,
+        ))
+
+        assert "repository_context" in with_context
+        assert "repository_context" not in without_context
+        assert "repository_skeleton" not in without_context
+
+    def test_skeleton_prefers_current_branch_in_single_read(self, temp_chroma_client):
+        """Test that the skeleton fetch reads once and prefers the current branch."""
+        from src.storage import get_or_create_collection
+        from src.tools.search.pipeline import SearchPipeline
+
+        collection = get_or_create_collection(temp_chroma_client, "cortex_memory")
+        collection.add(
+            documents=["main tree", "feature tree"],
+            ids=["TestRepo:skeleton:main", "TestRepo:skeleton:feature"],
+            metadatas=[
+                {"type": "skeleton", "repository": "TestRepo", "branch": "main", "total_files": 1},
+                {"type": "skeleton", "repository": "TestRepo", "branch": "feature", "total_files": 2},
+            ],
+        )
+        wrapped = MagicMock(wraps=collection)
+
+        pipeline = SearchPipeline(query="tree")
+        pipeline._collection = wrapped
+        pipeline._branches = ["feature"]
+        skeleton = pipeline._fetch_skeleton("TestRepo")
+
+        assert skeleton["branch"] == "feature"
+        assert skeleton["tree"] == "feature tree"
+        assert wrapped.get.call_count == 1
+
+        pipeline._branches = ["other"]
+        assert pipeline._fetch_skeleton("TestRepo")["repository"] == "TestRepo"
+
+    def test_score_filter_uses_type_boosted_score_without_recency(self):
+        """Test that min_score filters on the same score the response reports."""
+        from src.tools.search.pipeline import SearchPipeline
+
+        reranker = MagicMock()
+        reranker.rerank.return_value = [
+            {"text": "insight", "meta": {"type": "insight"}, "rerank_score": 0.4},
+            {"text": "code", "meta": {"type": "code"}, "rerank_score": 0.4},
+        ]
+        config = {
+            "top_k_rerank": 5, "recency_boost": False, "min_score": 0.0,
+            "staleness_check_enabled": False, "verbose": False,
+        }
+
+        with patch("src.tools.search.pipeline.CONFIG", config):
+            pipeline = SearchPipeline(query="q", min_score=0.5)
+            ranked = pipeline._apply_ranking(reranker, [])
+            results, _ = pipeline._format_results(ranked)
+
+        assert [r["meta"]["type"] for r in ranked] == ["insight"]
+        assert results[0]["score"] == 0.8
+
 
 class TestIngestCodeIntoCortex:
     """Tests for ingest_code_into_cortex tool."""
@@ -488,26 +565,24 @@ class TestContextTools:
 
         # Save both contexts
         collection.upsert(
-            ids=[tech_stack_id],
-            documents=["Python FastAPI backend"],
-            metadatas=[{
-                "type": "tech_stack",
-                "repository": repository,
-                "branch": "main",
-                "updated_at": timestamp,
-            }],
-        )
-        collection.upsert(
-            ids=[initiative_id],
-            documents=["User Auth\n\nStatus: Implementing"],
-            metadatas=[{
-                "type": "initiative",
-                "repository": repository,
-                "initiative_name": "User Auth",
-                "initiative_status": "Implementing",
-                "branch": "main",
-                "updated_at": timestamp,
-            }],
+            ids=[tech_stack_id, initiative_id],
+            documents=["Python FastAPI backend", "User Auth\n\nStatus: Implementing"],
+            metadatas=[
+                {
+                    "type": "tech_stack",
+                    "repository": repository,
+                    "branch": "main",
+                    "updated_at": timestamp,
+                },
+                {
+                    "type": "initiative",
+                    "repository": repository,
+                    "initiative_name": "User Auth",
+                    "initiative_status": "Implementing",
+                    "branch": "main",
+                    "updated_at": timestamp,
+                },
+            ],
         )
 
         # Retrieve both
@@ -581,26 +656,24 @@ class TestContextTools:
 
         # Add context
         collection.upsert(
-            ids=[tech_stack_id],
-            documents=["E-commerce platform with Python backend"],
-            metadatas=[{
-                "type": "tech_stack",
-                "repository": repository,
-                "branch": "main",
-                "updated_at": timestamp,
-            }],
-        )
-        collection.upsert(
-            ids=[initiative_id],
-            documents=["Checkout Flow\n\nStatus: Building"],
-            metadatas=[{
-                "type": "initiative",
-                "repository": repository,
-                "initiative_name": "Checkout Flow",
-                "initiative_status": "Building",
-                "branch": "main",
-                "updated_at": timestamp,
-            }],
+            ids=[tech_stack_id, initiative_id],
+            documents=["E-commerce platform with Python backend", "Checkout Flow\n\nStatus: Building"],
+            metadatas=[
+                {
+                    "type": "tech_stack",
+                    "repository": repository,
+                    "branch": "main",
+                    "updated_at": timestamp,
+                },
+                {
+                    "type": "initiative",
+                    "repository": repository,
+                    "initiative_name": "Checkout Flow",
+                    "initiative_status": "Building",
+                    "branch": "main",
+                    "updated_at": timestamp,
+                },
+            ],
         )
 
         # Simulate search_cortex context fetch pattern
@@ -766,10 +839,10 @@ class TestContextTools:
 class TestIntegration:
     """Integration tests for the full workflow."""
 
-    def test_full_workflow(self, temp_dir: Path, temp_chroma_client):
+    def test_full_workflow(self, temp_dir: Path, temp_chroma_client, reranker):
         """Test complete ingest -> search workflow."""
         from src.tools.ingest import ingest_codebase
-        from src.tools.search import HybridSearcher, RerankerService
+        from src.tools.search import HybridSearcher
         from src.storage import get_or_create_collection
 
         # Create test codebase
@@ -814,7 +887,6 @@ def validate_input(value):
         assert len(candidates) > 0
 
         # Rerank
-        reranker = RerankerService()
         reranked = reranker.rerank("calculator arithmetic", candidates, top_k=3)
 
         # Should find calculator-related content (file path, description, or exports)
@@ -932,6 +1004,17 @@ class TestBranchAwareFilter:
         result = build_branch_aware_filter(repository=None, branches=None)
         assert result is None
 
+    def test_filter_memoized_per_arguments(self):
+        """Test that identical arguments reuse the same filter dict."""
+        from src.tools.search.filters import build_branch_aware_filter
+
+        first = build_branch_aware_filter(repository="memo", branches=["feature", "main"], types=["note"])
+        second = build_branch_aware_filter(repository="memo", branches=["feature", "main"], types=["note"])
+        other = build_branch_aware_filter(repository="memo", branches=["main"], types=["note"])
+
+        assert first is second
+        assert other is not first
+
     def test_filter_code_types_filtered_by_branch(self):
         """Test that branch-filtered types (code, skeleton, etc.) are in the branch-filtered clause."""
         from src.tools.search.filters import build_branch_aware_filter
@@ -4,6 +4,8 @@ Tests for AST Module
 Tests tree-sitter parsing and language extractors.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from src.tools.ingest.ast.models import (
@@ -199,6 +201,19 @@ class TestParserSingleton:
         # Should have cached the parser
         assert "python" in parser._parsers
 
+    def test_parsers_are_per_thread(self):
+        parser = ASTParser()
+        parser.parse("x = 1", "python")
+        main_parser = parser._parsers["python"]
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            worker_parser = pool.submit(
+                lambda: (parser.parse("y = 2", "python"), parser._parsers["python"])[1]
+            ).result()
+
+        assert worker_parser is not main_parser
+        assert parser._languages["python"] is not None
+
 
 # =============================================================================
 # Model Tests
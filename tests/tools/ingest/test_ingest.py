@@ -3,6 +3,7 @@ Tests for ingest module
 """
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -136,6 +137,31 @@ class TestDeltaSync:
 
         assert hash1 != hash2
 
+    def test_mmap_hash_matches_buffered_hash(self, temp_dir: Path):
+        """Test that hashing via mmap produces the same digest as buffered reads."""
+        from src.tools.ingest.walker import MMAP_HASH_THRESHOLD
+
+        file_path = temp_dir / "large.bin"
+        file_path.write_bytes(b"x" * (MMAP_HASH_THRESHOLD + 1))
+
+        buffered = compute_file_hash(file_path)
+        mapped = compute_file_hash(file_path, size=file_path.stat().st_size)
+
+        assert buffered == mapped
+
+    def test_mmap_hash_handles_file_truncated_after_stat(self, temp_dir: Path):
+        """Test that a stale size from an earlier stat does not break hashing."""
+        import hashlib
+
+        from src.tools.ingest.walker import MMAP_HASH_THRESHOLD
+
+        file_path = temp_dir / "truncated.bin"
+        file_path.write_bytes(b"")
+
+        digest = compute_file_hash(file_path, size=MMAP_HASH_THRESHOLD + 1)
+
+        assert digest == hashlib.md5(b"").hexdigest()
+
     def test_get_changed_files(self, temp_dir: Path):
         """Test detection of changed files."""
         file1 = temp_dir / "file1.py"
@@ -152,6 +178,21 @@ class TestDeltaSync:
         assert "file2.py" in changed_names
         assert "file1.py" not in changed_names
 
+    def test_get_changed_files_trusts_matching_stat(self, temp_dir: Path):
+        """Test that a matching (size, mtime_ns) skips hashing and a new mtime forces it."""
+        file1 = temp_dir / "file1.py"
+        file1.write_text("content 1")
+        st = file1.stat()
+
+        # Recorded hash is deliberately wrong: only a re-hash would notice
+        state = {str(file1): "stale-hash"}
+        file_stats = {str(file1): (st.st_size, st.st_mtime_ns)}
+        assert get_changed_files([file1], state, file_stats) == []
+
+        os.utime(file1, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert get_changed_files([file1], state, file_stats) == [file1]
+
+
 class TestIngestion:
     """Tests for metadata-first file ingestion."""
 
@@ -252,6 +293,24 @@ class TestIngestion:
         # Should process all files even though unchanged
         assert stats["files_processed"] == 1
 
+    def test_emptied_file_metadata_removed_on_reingest(self, temp_dir: Path, temp_chroma_client):
+        """Test that emptying an indexed file drops its documents on the next delta sync."""
+        code_dir = temp_dir / "code"
+        code_dir.mkdir()
+        module = code_dir / "mod.py"
+        module.write_text("def hello():\n    pass\n\n\nclass Foo:\n    pass\n")
+
+        collection = get_or_create_collection(temp_chroma_client, "test_emptied")
+        ingest_codebase(root_path=str(code_dir), collection=collection, repo_id="emptied")
+
+        where = {"$and": [{"type": "file_metadata"}, {"file_path": str(module)}]}
+        assert len(collection.get(where=where)["ids"]) == 1
+
+        module.write_text("")
+        ingest_codebase(root_path=str(code_dir), collection=collection, repo_id="emptied")
+
+        assert collection.get(where=where)["ids"] == []
+
 class TestSkeleton:
     """Tests for skeleton index functionality."""
 
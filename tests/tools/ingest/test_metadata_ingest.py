@@ -118,6 +118,25 @@ class AuthService:
         finally:
             os.unlink(str(path))
 
+    def test_ingest_binary_content_skipped(self, mock_collection):
+        """Test that a NUL-containing file with a source extension is skipped."""
+        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
+            f.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+            path = Path(f.name)
+
+        try:
+            result = ingest_file_metadata(
+                file_path=path,
+                collection=mock_collection,
+                repo_id="test-repo",
+                branch="main",
+            )
+
+            assert "binary" in result.error
+            mock_collection.upsert.assert_not_called()
+        finally:
+            os.unlink(str(path))
+
     def test_ingest_with_data_contract(self, mock_collection):
         """Test that data contracts are extracted and stored."""
         with tempfile.NamedTemporaryFile(
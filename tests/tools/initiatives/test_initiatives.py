@@ -4,7 +4,7 @@ Tests for Initiative Management functionality.
 
 import json
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -293,6 +293,52 @@ class TestStalenessDetection:
         assert is_stale is False
 
 
+class TestInitiativeIndex:
+    """Tests for the cached initiative id/name index."""
+
+    def test_index_reused_until_initiative_created(self, temp_chroma_client):
+        """Test that name lookups reuse the loaded index until initiatives change."""
+        from src.tools.initiatives.initiatives import create_initiative
+        from src.tools.initiatives.utils import resolve_initiative, resolve_initiative_id
+
+        reset_services()
+        collection = get_or_create_collection(temp_chroma_client, "test_initiative_index")
+        set_collection(collection)
+
+        created = json.loads(create_initiative(repository="TestRepo", name="Indexed"))
+
+        spy = MagicMock(wraps=collection)
+        assert resolve_initiative_id(spy, "TestRepo", "Indexed") == created["initiative_id"]
+        assert resolve_initiative(spy, "TestRepo", "Indexed", lambda repo: (None, None)) == (
+            created["initiative_id"],
+            "Indexed",
+        )
+        assert spy.get.call_count == 1
+
+        # Creating an initiative invalidates the index
+        second = json.loads(create_initiative(repository="TestRepo", name="Later"))
+        assert resolve_initiative_id(collection, "TestRepo", "Later") == second["initiative_id"]
+
+    def test_index_safe_under_concurrent_loads(self):
+        """Test that concurrent loads across epoch bumps never trip over the stale-entry sweep."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.tools.initiatives.utils import bump_initiative_epoch, load_initiative_index
+
+        collection = MagicMock()
+        collection.get.return_value = {"ids": ["initiative:a"], "metadatas": [{"name": "A"}]}
+
+        def load(i: int) -> dict:
+            if i % 4 == 0:
+                bump_initiative_epoch()
+            return load_initiative_index(collection, f"repo{i % 8}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            indexes = list(pool.map(load, range(400)))
+
+        assert all(index["by_name"] == {"A": "initiative:a"} for index in indexes)
+
+
 class TestInitiativeTagging:
     """Tests for tagging session summaries/notes with initiatives."""
 
@@ -199,6 +199,26 @@ class TestDeleteDocument:
             # Should NOT rebuild search index on error
             mock_searcher.build_index.assert_not_called()
 
+    def test_deleted_initiative_no_longer_resolves(self, temp_chroma_client):
+        """Deleting an initiative invalidates cached initiative lookups."""
+        from src.configs.services import reset_services, set_collection
+        from src.storage import get_or_create_collection
+        from src.tools.initiatives.initiatives import create_initiative
+        from src.tools.maintenance.maintenance import delete_document
+        from src.tools.memory.helpers import resolve_initiative_cached
+
+        reset_services()
+        collection = get_or_create_collection(temp_chroma_client, "test_delete_initiative")
+        set_collection(collection)
+
+        created = json.loads(create_initiative(repository="TestRepo", name="Doomed"))
+        initiative_id = created["initiative_id"]
+        assert resolve_initiative_cached(collection, "TestRepo", "Doomed")[0] == initiative_id
+
+        assert json.loads(delete_document(initiative_id))["status"] == "deleted"
+
+        assert resolve_initiative_cached(collection, "TestRepo", "Doomed")[0] != initiative_id
+
     def test_delete_document_handles_exception(self):
         """delete_document returns error on exception."""
         from src.tools.maintenance.maintenance import delete_document
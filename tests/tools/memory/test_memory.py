@@ -67,6 +67,26 @@ class TestSaveMemory:
         assert result["note_id"].startswith("note:")
         assert result["title"] == "Test Note"
 
+    def test_save_note_async_write(self, mock_services):
+        """Test that async_note_writes queues the write and flush_writes applies it."""
+        from src.storage.write_queue import flush_writes
+        from src.tools.memory import save_memory
+
+        collection = mock_services
+        with patch.dict("src.configs.services.CONFIG", {"async_note_writes": True}):
+            result = json.loads(save_memory(
+                content="Queued note",
+                kind="note",
+                repository="TestRepo"
+            ))
+
+        assert result["status"] == "saved"
+        assert result["write"] == "queued"
+
+        flush_writes()
+        stored = collection.get(ids=[result["note_id"]])
+        assert stored["ids"] == [result["note_id"]]
+
     def test_save_insight_via_save_memory(self, mock_services):
         """Test saving an insight through save_memory."""
         from src.tools.memory import save_memory
@@ -318,6 +338,76 @@ class TestBuildBaseContext:
 
         assert ctx["initiative_id"] == "initiative:ctx123"
         assert ctx["initiative_name"] == "Context Test"
+        assert ctx["common_meta"]["initiative_id"] == "initiative:ctx123"
+        assert ctx["common_meta"]["initiative_name"] == "Context Test"
+
+    def test_initiative_resolution_cached_until_epoch_bump(self, mock_services):
+        """Test that repeated saves reuse the initiative lookup until initiatives change."""
+        from src.tools.initiatives.utils import bump_initiative_epoch
+        from src.tools.memory.helpers import build_base_context
+
+        with patch(
+            "src.tools.memory.helpers.resolve_initiative",
+            return_value=("initiative:abc", "Cached"),
+        ) as mock_resolve:
+            build_base_context("TestRepo", None)
+            ctx = build_base_context("TestRepo", None)
+
+            assert mock_resolve.call_count == 1
+            assert ctx["initiative_id"] == "initiative:abc"
+
+            bump_initiative_epoch()
+            build_base_context("TestRepo", None)
+
+            assert mock_resolve.call_count == 2
+
+    def test_concurrent_initiative_lookups_coalesce(self, mock_services):
+        """Test that concurrent saves for the same initiative share one lookup."""
+        import threading
+
+        from src.tools.memory.helpers import resolve_initiative_cached
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_resolve(*args):
+            started.set()
+            release.wait(timeout=5)
+            return ("initiative:abc", "Shared")
+
+        collection = MagicMock()
+        results = []
+        with patch("src.tools.memory.helpers.resolve_initiative", side_effect=slow_resolve) as mock_resolve:
+            first = threading.Thread(
+                target=lambda: results.append(resolve_initiative_cached(collection, "TestRepo", "Shared"))
+            )
+            first.start()
+            started.wait(timeout=5)
+            second = threading.Thread(
+                target=lambda: results.append(resolve_initiative_cached(collection, "TestRepo", "Shared"))
+            )
+            second.start()
+            release.set()
+            first.join(timeout=5)
+            second.join(timeout=5)
+
+        assert mock_resolve.call_count == 1
+        assert results == [("initiative:abc", "Shared")] * 2
+
+    def test_common_meta_omits_missing_fields(self, mock_services):
+        """Test that common_meta only contains fields that are set."""
+        from src.tools.memory.helpers import build_base_context
+
+        ctx = build_base_context("TestRepo", None)
+
+        # repo_path is None (mocked), so no commit and no initiative
+        assert ctx["common_meta"] == {
+            "repository": "TestRepo",
+            "branch": "unknown",
+            "created_at": ctx["timestamp"],
+            "updated_at": ctx["timestamp"],
+            "status": "active",
+        }
 
 
 class TestComputeFileHashes:
@@ -433,7 +523,7 @@ class TestSearchIndexRebuild:
     """Tests for search index rebuild after save operations."""
 
     def test_index_rebuilt_after_save_note(self, mock_services):
-        """Test that search index is rebuilt after saving a note."""
+        """Test that the saved note is added to the search index."""
         from src.tools.memory import save_memory
 
         with patch("src.tools.memory.save.get_searcher") as mock_get_searcher:
@@ -446,10 +536,10 @@ class TestSearchIndexRebuild:
                 repository="TestRepo"
             )
 
-            mock_searcher.build_index.assert_called_once()
+            mock_searcher.add_document.assert_called_once()
 
     def test_index_rebuilt_after_conclude_session(self, mock_services):
-        """Test that search index is rebuilt after concluding session."""
+        """Test that the session summary is added to the search index."""
         from src.tools.memory import conclude_session
 
         with patch("src.tools.memory.session.get_searcher") as mock_get_searcher:
@@ -462,4 +552,23 @@ class TestSearchIndexRebuild:
                 repository="TestRepo"
             )
 
-            mock_searcher.build_index.assert_called_once()
+            mock_searcher.add_document.assert_called_once()
+
+    def test_index_marked_dirty_when_initiative_touched(self, mock_services):
+        """Test that tagging an initiative falls back to a rebuild of the index."""
+        from src.tools.memory import conclude_session
+
+        with patch("src.tools.memory.session.get_searcher") as mock_get_searcher, \
+             patch("src.tools.memory.helpers.resolve_initiative",
+                   return_value=("initiative:abc", "Auth Migration")):
+            mock_searcher = MagicMock()
+            mock_get_searcher.return_value = mock_searcher
+
+            conclude_session(
+                summary="Test summary",
+                changed_files=["test.py"],
+                repository="TestRepo"
+            )
+
+            mock_searcher.mark_dirty.assert_called_once()
+            mock_searcher.add_document.assert_not_called()
@@ -85,15 +85,18 @@ class TestValidateInsight:
             assert result["insight_id"] == "insight:abc123"
             assert "verified_at" in result
 
-            # Should update metadata
-            mock_collection.upsert.assert_called_once()
-            call_kwargs = mock_collection.upsert.call_args[1]
+            # Should fetch and update metadata only
+            assert mock_collection.get.call_args[1]["include"] == ["metadatas"]
+            mock_collection.upsert.assert_not_called()
+            mock_collection.update.assert_called_once()
+            call_kwargs = mock_collection.update.call_args[1]
+            assert "documents" not in call_kwargs
             meta = call_kwargs["metadatas"][0]
             assert meta["last_validation_result"] == "still_valid"
             assert "verified_at" in meta
 
-            # Should rebuild search index
-            mock_searcher.build_index.assert_called_once()
+            # Should schedule a search index rebuild
+            mock_searcher.mark_dirty.assert_called_once()
 
     def test_validate_insight_still_valid_refreshes_hashes(self):
         """validate_insight refreshes file hashes when marked still_valid."""
@@ -128,11 +131,51 @@ class TestValidateInsight:
 
             assert result["file_hashes_refreshed"] is True
 
-            call_kwargs = mock_collection.upsert.call_args[1]
+            call_kwargs = mock_collection.update.call_args[1]
             meta = call_kwargs["metadatas"][0]
             assert "new_hash" in meta["file_hashes"]
             assert meta["validated_commit"] == "def456"
 
+    def test_validate_insight_still_valid_unchanged_hashes(self):
+        """validate_insight writes metadata only when file hashes are unchanged."""
+        from src.tools.memory.validate import validate_insight
+
+        mock_collection = MagicMock()
+        mock_collection.get.return_value = {
+            "ids": ["insight:abc123"],
+            "documents": ["This insight describes pattern X"],
+            "metadatas": [{
+                "type": "insight",
+                "files": '["src/a.py"]',
+                "file_hashes": '{"src/a.py": "hash1"}',
+                "created_at": "2024-01-01T00:00:00Z",
+            }],
+        }
+        mock_searcher = MagicMock()
+
+        with patch("src.tools.memory.validate.get_collection", return_value=mock_collection), \
+             patch("src.tools.memory.validate.get_searcher", return_value=mock_searcher), \
+             patch("src.tools.memory.validate.get_repo_path", return_value="/test/repo"), \
+             patch("src.tools.memory.validate.get_head_commit", return_value="def456"), \
+             patch("src.tools.memory.validate.compute_file_hashes", return_value={"src/a.py": "hash1"}), \
+             patch("src.tools.memory.validate.resolve_repository", return_value="test-repo"):
+
+            result = json.loads(validate_insight(
+                insight_id="insight:abc123",
+                validation_result="still_valid",
+            ))
+
+            assert result["status"] == "validated"
+            assert "file_hashes_refreshed" not in result
+
+            mock_collection.upsert.assert_not_called()
+            mock_collection.update.assert_called_once()
+            call_kwargs = mock_collection.update.call_args[1]
+            assert "documents" not in call_kwargs
+            meta = call_kwargs["metadatas"][0]
+            assert meta["validated_commit"] == "def456"
+            assert meta["last_validation_result"] == "still_valid"
+
     def test_validate_insight_partially_valid(self):
         """validate_insight handles partially_valid status."""
         from src.tools.memory.validate import validate_insight
@@ -162,7 +205,7 @@ class TestValidateInsight:
             assert result["status"] == "validated"
             assert result["validation_result"] == "partially_valid"
 
-            call_kwargs = mock_collection.upsert.call_args[1]
+            call_kwargs = mock_collection.update.call_args[1]
             meta = call_kwargs["metadatas"][0]
             assert meta["last_validation_result"] == "partially_valid"
             assert meta["validation_notes"] == "The main pattern is correct but some details changed"
@@ -228,7 +271,7 @@ class TestValidateInsight:
             assert result["status"] == "validated"
             assert result["deprecated"] is True
 
-            call_kwargs = mock_collection.upsert.call_args[1]
+            call_kwargs = mock_collection.update.call_args[1]
             meta = call_kwargs["metadatas"][0]
             assert meta["status"] == "deprecated"
             assert "deprecated_at" in meta
@@ -276,7 +319,7 @@ class TestValidateInsight:
             assert result["replacement_id"] == "insight:new456"
 
             # Old insight should point to replacement
-            call_kwargs = mock_collection.upsert.call_args[1]
+            call_kwargs = mock_collection.update.call_args[1]
             meta = call_kwargs["metadatas"][0]
             assert meta["superseded_by"] == "insight:new456"
 
@@ -305,7 +348,7 @@ class TestValidateInsight:
 
             assert result["status"] == "validated"
 
-            call_kwargs = mock_collection.upsert.call_args[1]
+            call_kwargs = mock_collection.update.call_args[1]
             meta = call_kwargs["metadatas"][0]
             assert meta["validation_notes"] == "Verified after reviewing src/a.py changes"
 
@@ -337,7 +380,7 @@ class TestValidateInsight:
 
             assert result["status"] == "validated"
 
-            call_kwargs = mock_collection.upsert.call_args[1]
+            call_kwargs = mock_collection.update.call_args[1]
             meta = call_kwargs["metadatas"][0]
             assert "created_at" in meta
 
@@ -383,6 +426,6 @@ class TestValidateInsight:
             assert result["status"] == "validated"
             assert "deprecated" not in result
 
-            call_kwargs = mock_collection.upsert.call_args[1]
+            call_kwargs = mock_collection.update.call_args[1]
             meta = call_kwargs["metadatas"][0]
             assert meta.get("status") != "deprecated"
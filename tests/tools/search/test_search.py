@@ -7,9 +7,9 @@ import pytest
 from src.tools.search import (
     BM25Index,
     HybridSearcher,
-    RerankerService,
     apply_recency_boost,
     reciprocal_rank_fusion,
+    tokenize_code,
 )
 from src.storage import get_or_create_collection
 
@@ -142,10 +142,8 @@ class TestHybridSearcher:
 class TestRerankerService:
     """Tests for reranking functionality."""
 
-    def test_rerank_basic(self):
+    def test_rerank_basic(self, reranker):
         """Test basic reranking."""
-        reranker = RerankerService()
-
         documents = [
             {"text": "This is about cats and dogs"},
             {"text": "Programming in Python is fun"},
@@ -159,16 +157,13 @@ class TestRerankerService:
         # Programming document should rank higher than snake document
         assert "Programming" in results[0]["text"] or "Python" in results[0]["text"]
 
-    def test_rerank_empty(self):
+    def test_rerank_empty(self, reranker):
         """Test reranking empty document list."""
-        reranker = RerankerService()
         results = reranker.rerank("query", [], top_k=5)
         assert results == []
 
-    def test_rerank_preserves_metadata(self):
+    def test_rerank_preserves_metadata(self, reranker):
         """Test that reranking preserves document metadata."""
-        reranker = RerankerService()
-
         documents = [
             {"text": "Python programming", "source": "docs", "page": 1},
             {"text": "JavaScript tutorial", "source": "blog", "page": 5},
@@ -352,6 +347,91 @@ class TestConditionalIndexRebuild:
 
         assert build_count[0] == 1, "rebuild_index=True should force rebuild"
 
+    def test_mark_dirty_debounces_rebuilds(self, temp_chroma_client):
+        """Bursts of mark_dirty() calls collapse into one background rebuild."""
+        collection = get_or_create_collection(temp_chroma_client, "test_debounce")
+        collection.add(
+            documents=["first document"],
+            ids=["1"],
+            metadatas=[{"type": "test"}],
+        )
+
+        searcher = HybridSearcher(collection)
+        searcher.build_index()
+
+        build_count = [0]
+        original_build = searcher.bm25_index.build_from_collection
+
+        def counting_build(*args, **kwargs):
+            build_count[0] += 1
+            return original_build(*args, **kwargs)
+
+        searcher.bm25_index.build_from_collection = counting_build
+
+        timers = []
+        for _ in range(5):
+            searcher.mark_dirty()
+            timers.append(searcher._rebuild_timer)
+        assert build_count[0] == 0, "mark_dirty should not rebuild synchronously"
+
+        # Each write replaces the pending timer, cancelling the previous one
+        assert len(set(timers)) == 5
+        assert all(timer.finished.is_set() for timer in timers[:-1])
+
+        # Fire the surviving timer's callback directly instead of waiting
+        timers[-1].cancel()
+        searcher._rebuild_if_dirty()
+        assert build_count[0] == 1, "Burst of writes should trigger exactly one rebuild"
+        assert searcher._rebuild_timer is None
+
+        # Index is fresh again, so searching does not rebuild
+        searcher.search("first")
+        assert build_count[0] == 1
+
+    def test_add_document_updates_index_incrementally(self, temp_chroma_client):
+        """add_document() makes a new document searchable without a rebuild."""
+        collection = get_or_create_collection(temp_chroma_client, "test_incremental")
+        collection.add(
+            documents=["alpha beta", "gamma delta"],
+            ids=["1", "2"],
+            metadatas=[{"type": "note"}, {"type": "note"}],
+        )
+
+        searcher = HybridSearcher(collection)
+        searcher.build_index(where_filter={"type": "note"})
+
+        build_count = [0]
+        original_build = searcher.bm25_index.build_from_collection
+
+        def counting_build(*args, **kwargs):
+            build_count[0] += 1
+            return original_build(*args, **kwargs)
+
+        searcher.bm25_index.build_from_collection = counting_build
+
+        searcher.add_document("3", "epsilon zeta", {"type": "note"})
+        assert build_count[0] == 0
+        assert searcher.bm25_index.doc_ids == ["1", "2", "3"]
+
+        results = searcher.bm25_index.search("epsilon")
+        assert results[0]["id"] == "3"
+
+        # Scores match a from-scratch build over the same corpus
+        fresh = BM25Index()
+        collection.add(documents=["epsilon zeta"], ids=["3"], metadatas=[{"type": "note"}])
+        fresh.build_from_collection(collection, where_filter={"type": "note"})
+        for query in ("epsilon", "alpha delta", "zeta zeta beta"):
+            incremental = searcher.bm25_index.index.get_scores(tokenize_code(query))
+            assert incremental == pytest.approx(fresh.index.get_scores(tokenize_code(query)))
+
+        # Re-adding an indexed document is left to a full rebuild
+        assert searcher.bm25_index.add("3", "epsilon zeta", {"type": "note"}) is False
+
+        # Documents outside the index filter are skipped
+        searcher.add_document("4", "outside", {"type": "code"})
+        assert "4" not in searcher.bm25_index.doc_ids
+        assert build_count[0] == 0
+
     def test_thread_safety(self, temp_chroma_client):
         """Multiple threads should not cause race conditions."""
         import threading
@@ -390,3 +470,66 @@ class TestConditionalIndexRebuild:
             t.join()
 
         assert len(errors) == 0, f"Thread safety errors: {errors}"
+
+
+class TestSearchCache:
+    """Tests for the search response cache."""
+
+    def setup_method(self):
+        from src.tools.search.cache import clear_search_cache
+
+        clear_search_cache()
+
+    def test_hit_within_ttl(self):
+        """A stored response is returned for the same key."""
+        from src.tools.search.cache import cache_search, get_cached_search
+
+        cache_search(("query", 1), '{"results": []}')
+
+        assert get_cached_search(("query", 1)) == '{"results": []}'
+        assert get_cached_search(("other", 1)) is None
+
+    def test_expired_entry_is_a_miss(self):
+        """Entries older than the TTL are not returned."""
+        from unittest.mock import patch
+
+        from src.tools.search import cache
+
+        with patch("src.tools.search.cache.time.monotonic", return_value=1000.0):
+            cache.cache_search(("query",), "response")
+        with patch(
+            "src.tools.search.cache.time.monotonic",
+            return_value=1000.0 + cache.SEARCH_CACHE_TTL_SECONDS + 1,
+        ):
+            assert cache.get_cached_search(("query",)) is None
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when the cache is full."""
+        from unittest.mock import patch
+
+        from src.tools.search import cache
+
+        with patch.object(cache, "SEARCH_CACHE_MAX_ENTRIES", 2):
+            cache.cache_search(("a",), "A")
+            cache.cache_search(("b",), "B")
+            cache.get_cached_search(("a",))  # "a" becomes most recent
+            cache.cache_search(("c",), "C")
+
+        assert cache.get_cached_search(("a",)) == "A"
+        assert cache.get_cached_search(("b",)) is None
+        assert cache.get_cached_search(("c",)) == "C"
+
+    def test_writes_bump_epoch(self, temp_chroma_client):
+        """Index writes move the epoch so earlier cache keys stop matching."""
+        from src.tools.search.cache import get_search_epoch
+
+        collection = get_or_create_collection(temp_chroma_client, "test_cache_epoch")
+        searcher = HybridSearcher(collection)
+
+        before = get_search_epoch()
+        searcher.add_document("1", "new note", {"type": "note"})
+        assert get_search_epoch() > before
+
+        before = get_search_epoch()
+        searcher.build_index()
+        assert get_search_epoch() > before
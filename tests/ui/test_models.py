@@ -0,0 +1,119 @@
+"""
+Tests for the browser data models (src/ui/models.py).
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from src.ui.models import Document, DocumentSummary, SearchResponse, SearchResult, Stats
+
+
+class TestStats:
+    """Tests for Stats."""
+
+    def test_from_dict_copies_breakdowns(self):
+        """Test that breakdowns are copied into plain dicts and missing ones default to empty."""
+        by_type = {"note": 3, "insight": 1}
+        stats = Stats.from_dict({"total_documents": 4, "by_type": by_type})
+
+        assert stats.total_documents == 4
+        assert stats.by_type == by_type
+        assert stats.by_type is not by_type
+        assert stats.by_repository == {}
+        assert stats.by_language == {}
+
+    def test_pickle_and_deepcopy_round_trip(self):
+        """Test that Stats survives pickling and deepcopy."""
+        stats = Stats.from_dict({
+            "total_documents": 2,
+            "by_repository": {"Cortex": 2},
+            "by_language": {"python": 2},
+        })
+
+        assert pickle.loads(pickle.dumps(stats)) == stats
+        assert copy.deepcopy(stats) == stats
+
+
+class TestDocumentSummary:
+    """Tests for DocumentSummary."""
+
+    def test_from_dict_reads_metadata(self):
+        """Test that summary fields come from metadata, with defaults when it is missing."""
+        summary = DocumentSummary.from_dict({
+            "id": "note:1",
+            "metadata": {"type": "note", "repository": "Cortex", "title": "Plan"},
+        })
+        assert (summary.id, summary.doc_type, summary.repository, summary.title) == (
+            "note:1", "note", "Cortex", "Plan",
+        )
+
+        empty = DocumentSummary.from_dict({"id": "x", "metadata": None})
+        assert (empty.doc_type, empty.repository, empty.title) == ("unknown", "unknown", None)
+
+
+class TestDocument:
+    """Tests for Document."""
+
+    def test_derived_fields_follow_metadata(self):
+        """Test that derived fields are set at construction and re-derived by replace()."""
+        doc = Document.from_dict({
+            "id": "insight:1",
+            "content": "text",
+            "metadata": {"type": "insight", "repository": "Cortex", "title": "Cache"},
+        })
+        assert (doc.doc_type, doc.repository, doc.title) == ("insight", "Cortex", "Cache")
+
+        renamed = dataclasses.replace(doc, metadata={**doc.metadata, "title": "Renamed"})
+        assert renamed.title == "Renamed"
+
+    def test_missing_metadata_defaults(self):
+        """Test derived defaults when metadata has no type, repository or title."""
+        doc = Document.from_dict({"id": "x"})
+        assert (doc.doc_type, doc.repository, doc.title) == ("unknown", "unknown", None)
+
+
+class TestSearchModels:
+    """Tests for SearchResult and SearchResponse."""
+
+    @pytest.mark.parametrize("scores, expected", [
+        ({"rerank": 0.9, "rrf": 0.2}, 0.9),
+        ({"rrf": 0.2}, 0.2),
+        (None, 0.0),
+    ], ids=["rerank", "rrf_only", "no_scores"])
+    def test_best_score(self, scores, expected):
+        """Test that best_score prefers rerank, then RRF, then 0."""
+        result = SearchResult.from_dict({"id": "a", "metadata": {}, "scores": scores})
+        assert result.best_score == expected
+
+    def test_response_from_dict(self):
+        """Test that results are built in order and missing timing/results default sensibly."""
+        response = SearchResponse.from_dict({
+            "query": "cache",
+            "results": [
+                {"id": "a", "metadata": {"type": "note"}, "scores": {"rrf": 0.5}},
+                {"id": "b", "metadata": {"type": "insight"}},
+            ],
+            "timing": {"total_ms": 12.5},
+            "result_count": 2,
+        })
+        assert [r.id for r in response.results] == ["a", "b"]
+        assert [r.doc_type for r in response.results] == ["note", "insight"]
+        assert response.timing_ms == 12.5
+
+        empty = SearchResponse.from_dict({"query": "q", "results": None, "timing": None})
+        assert (empty.results, empty.timing_ms, empty.result_count) == ([], 0, 0)
+
+    def test_pickle_and_copy_round_trip(self):
+        """Test that slotted models with derived fields survive pickle, copy and deepcopy."""
+        response = SearchResponse.from_dict({
+            "query": "cache",
+            "results": [{"id": "a", "metadata": {"type": "note", "title": "T"}, "scores": {"rerank": 0.7}}],
+        })
+
+        for clone in (pickle.loads(pickle.dumps(response)), copy.copy(response), copy.deepcopy(response)):
+            assert clone == response
+            assert clone.results[0].title == "T"
+            assert clone.results[0].best_score == 0.7
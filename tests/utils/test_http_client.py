@@ -0,0 +1,113 @@
+"""
+Tests for the HTTP client helpers (src/utils/http_client.py).
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.exceptions import HTTPConnectionError, HTTPTimeoutError
+from src.utils import http_client
+from src.utils.http_client import http_get, http_json_get, invalidate_cache, set_default_headers
+
+
+def _json_response(body: bytes, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.content = body
+    response.headers = headers or {}
+    response.json.side_effect = lambda: json.loads(body)
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_get_cache():
+    invalidate_cache()
+    yield
+    invalidate_cache()
+
+
+class TestJsonGetCache:
+    """Tests for the http_json_get response cache."""
+
+    def test_repeat_get_served_from_cache(self):
+        """Test that an identical GET skips the network and returns a fresh dict."""
+        with patch.object(http_client._SESSION, "get", return_value=_json_response(b'{"models": []}')) as mock_get:
+            first = http_json_get("http://ollama/api/tags", cache=True)
+            first["models"].append("mutated")
+            second = http_json_get("http://ollama/api/tags", cache=True)
+
+        assert mock_get.call_count == 1
+        assert second == {"models": []}
+
+    def test_uncached_and_invalidated_gets_go_to_network(self):
+        """Test that the default, invalidation, and Cache-Control: no-store bypass the cache."""
+        with patch.object(http_client._SESSION, "get", return_value=_json_response(b'{"ok": true}')) as mock_get:
+            http_json_get("http://host/a")
+            http_json_get("http://host/a")
+            http_json_get("http://host/a", cache=True)
+            invalidate_cache("http://host/a")
+            http_json_get("http://host/a", cache=True)
+
+        assert mock_get.call_count == 4
+
+        with patch.object(
+            http_client._SESSION, "get",
+            return_value=_json_response(b'{"ok": true}', {"Cache-Control": "no-store"}),
+        ) as mock_get:
+            http_json_get("http://host/b", cache=True)
+            http_json_get("http://host/b", cache=True)
+
+        assert mock_get.call_count == 2
+
+    def test_expired_entry_revalidated_with_etag(self):
+        """Test that an expired entry sends If-None-Match and reuses the body on 304."""
+        fresh = _json_response(b'{"tags": ["1.0.0"]}', {"ETag": '"v1"'})
+        fresh.status_code = 200
+        not_modified = _json_response(b"", {})
+        not_modified.status_code = 304
+
+        with patch.object(http_client._SESSION, "get", side_effect=[fresh, not_modified]) as mock_get, \
+             patch.object(http_client, "JSON_GET_CACHE_TTL_SECONDS", -1):
+            http_json_get("http://registry/tags", cache=True)
+            data = http_json_get("http://registry/tags", cache=True)
+
+        assert data == {"tags": ["1.0.0"]}
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+class TestErrorTranslation:
+    """Tests for mapping requests exceptions to Cortex exceptions."""
+
+    @pytest.mark.parametrize("error, expected", [
+        (requests.exceptions.ConnectionError(), HTTPConnectionError),
+        (requests.exceptions.ConnectTimeout(), HTTPConnectionError),
+        (requests.exceptions.ReadTimeout(), HTTPTimeoutError),
+    ])
+    def test_request_errors_translated(self, error, expected):
+        """Test that requests exceptions (including subclasses) map to Cortex types."""
+        with patch.object(http_client._SESSION, "get", side_effect=error):
+            with pytest.raises(expected) as exc_info:
+                http_get("http://host/x")
+
+        assert exc_info.value.__cause__ is error
+
+
+class TestDefaultHeaders:
+    """Tests for session-wide default headers."""
+
+    def test_default_headers_sent_with_requests(self):
+        """Test that defaults apply to every request and per-call headers still merge over them."""
+        original = dict(http_client._SESSION.headers)
+        try:
+            set_default_headers({"X-Cortex-Test": "1", "User-Agent": "Cortex"})
+            assert http_client._SESSION.headers["X-Cortex-Test"] == "1"
+
+            request = requests.Request("GET", "http://host/x", headers={"User-Agent": "Override"})
+            prepared = http_client._SESSION.prepare_request(request)
+            assert prepared.headers["User-Agent"] == "Override"
+            assert prepared.headers["X-Cortex-Test"] == "1"
+        finally:
+            http_client._SESSION.headers.clear()
+            http_client._SESSION.headers.update(original)